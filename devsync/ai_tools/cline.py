@@ -4,7 +4,7 @@ from pathlib import Path
 
 from devsync.ai_tools.base import AITool
 from devsync.core.models import AIToolType
-from devsync.utils.paths import get_cline_config_dir
+from devsync.utils.paths import ensure_directory_exists, get_cline_config_dir
 
 
 class ClineTool(AITool):
@@ -88,5 +88,5 @@ class ClineTool(AITool):
             Path to project instructions directory (.clinerules/)
         """
         instructions_dir = project_root / ".clinerules"
-        instructions_dir.mkdir(parents=True, exist_ok=True)
+        ensure_directory_exists(instructions_dir)
         return instructions_dir
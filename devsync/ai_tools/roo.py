@@ -4,7 +4,7 @@ from pathlib import Path
 
 from devsync.ai_tools.base import AITool
 from devsync.core.models import AIToolType
-from devsync.utils.paths import get_roo_config_dir
+from devsync.utils.paths import ensure_directory_exists, get_roo_config_dir
 
 
 class RooTool(AITool):
@@ -64,7 +64,7 @@ class RooTool(AITool):
         from devsync.utils.paths import get_home_directory
 
         global_dir = get_home_directory() / ".roo" / "rules"
-        global_dir.mkdir(parents=True, exist_ok=True)
+        ensure_directory_exists(global_dir)
         return global_dir
 
     def get_instruction_file_extension(self) -> str:
@@ -93,7 +93,7 @@ class RooTool(AITool):
             Path to project instructions directory (.roo/rules/)
         """
         instructions_dir = project_root / ".roo" / "rules"
-        instructions_dir.mkdir(parents=True, exist_ok=True)
+        ensure_directory_exists(instructions_dir)
         return instructions_dir
 
     def get_mcp_config_path(self) -> Path:
@@ -1,10 +1,12 @@
 """Extract command — reads project configs and produces a shareable package."""
 
+import os
 import shutil
 import warnings
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
@@ -17,12 +19,21 @@ from devsync.core.component_detector import (
     filter_detection_result,
 )
 from devsync.core.extractor import PracticeExtractor
-from devsync.core.package_manifest_v2 import PackageManifestV2, detect_manifest_format, parse_manifest
+from devsync.core.package_manifest_v2 import (
+    ComponentRef,
+    PackageManifestV2,
+    detect_manifest_format,
+    parse_manifest,
+)
 from devsync.llm.config import load_config
 from devsync.llm.provider import resolve_provider
+from devsync.utils.paths import ensure_directory_exists
 
 console = Console()
 
+_MAX_IO_WORKERS = 8
+_MAX_INSTRUCTION_BYTES = 100_000
+
 # Map DetectionResult field names back to user-facing component names
 _FIELD_TO_LABEL: dict[str, str] = {
     "instructions": "Rules",
@@ -225,7 +236,11 @@ def extract_command(
         console=console,
     ) as progress:
         task = progress.add_task("Extracting practices...", total=None)
-        result = extractor.extract(project_path, detection=detection)
+        try:
+            result = extractor.extract(project_path, detection=detection)
+        finally:
+            if llm:
+                llm.close()
         progress.update(task, description="Building package...")
 
     output_path.mkdir(parents=True, exist_ok=True)
@@ -243,19 +258,11 @@ def extract_command(
         _copy_source_files(project_path, output_path, result.source_files)
         components: dict = {}
         if result.source_files:
-            from devsync.core.package_manifest_v2 import ComponentRef
-
-            components["instructions"] = [
-                ComponentRef(
-                    name=Path(f).stem,
-                    file=f"instructions/{Path(f).name}",
-                )
-                for f in result.source_files
-            ]
+            components["instructions"] = _instruction_refs(result.source_files)
         manifest.components = components
 
     manifest_path = output_path / "devsync-package.yaml"
-    manifest_path.write_text(manifest.to_yaml())
+    manifest_path.write_bytes(manifest.to_yaml_bytes())
 
     # Enhanced output
     mode = "[green]AI-powered[/green]" if result.ai_powered else "[yellow]file-copy[/yellow]"
@@ -292,6 +299,7 @@ def _upgrade_v1_package(
         console.print(f"[red]Not a directory: {package_path}[/red]")
         return 1
 
+    # Only the format is needed to bail out on v2; parse just the v1 manifest
     fmt = detect_manifest_format(package_path)
     if not fmt:
         console.print(f"[red]No manifest found in {package_path}[/red]")
@@ -305,23 +313,30 @@ def _upgrade_v1_package(
     v1_manifest = parse_manifest(package_path)
     console.print(f"\n[bold]Upgrading v1 package: {v1_manifest.name} v{v1_manifest.version}[/bold]")
 
-    instruction_files: dict[str, str] = {}
+    pkg_resolved = package_path.resolve()
+    candidates: list[tuple[str, Path]] = []
     for comp_type, refs in v1_manifest.components.items():
         if comp_type != "instructions":
             continue
         for ref in refs:
-            src_file = (package_path / ref.file).resolve()
-            try:
-                src_file.relative_to(package_path.resolve())
-            except ValueError:
+            src_file = (pkg_resolved / ref.file).resolve()
+            if not src_file.is_relative_to(pkg_resolved):
                 console.print(f"  [red]Rejected (path traversal): {ref.file}[/red]")
                 continue
-            if src_file.exists() and src_file.stat().st_size < 100_000:
-                try:
-                    content = src_file.read_text(encoding="utf-8")
-                    instruction_files[ref.file] = content
-                except (OSError, UnicodeDecodeError):
-                    console.print(f"  [yellow]Could not read: {ref.file}[/yellow]")
+            candidates.append((ref.file, src_file))
+
+    instruction_files: dict[str, str] = {}
+    if candidates:
+        with ThreadPoolExecutor(max_workers=min(_MAX_IO_WORKERS, len(candidates))) as executor:
+            reads = [(ref_file, executor.submit(_read_if_small, src_file)) for ref_file, src_file in candidates]
+        for ref_file, future in reads:
+            try:
+                content = future.result()
+            except (OSError, UnicodeDecodeError):
+                console.print(f"  [yellow]Could not read: {ref_file}[/yellow]")
+                continue
+            if content is not None:
+                instruction_files[ref_file] = content
 
     if not instruction_files:
         console.print("[red]No instruction files found in v1 package.[/red]")
@@ -343,7 +358,10 @@ def _upgrade_v1_package(
     ) as progress:
         task = progress.add_task("Converting to v2...", total=None)
         if llm:
-            result = extractor._extract_with_ai(instruction_files, [])
+            try:
+                result = extractor._extract_with_ai(instruction_files, [])
+            finally:
+                llm.close()
         else:
             result = extractor._extract_without_ai(instruction_files, [])
         progress.update(task, description="Building v2 package...")
@@ -364,16 +382,10 @@ def _upgrade_v1_package(
 
     if not result.ai_powered:
         _copy_source_files(package_path, output_path, list(instruction_files.keys()))
-        from devsync.core.package_manifest_v2 import ComponentRef
-
-        v2_manifest.components = {
-            "instructions": [
-                ComponentRef(name=Path(f).stem, file=f"instructions/{Path(f).name}") for f in instruction_files
-            ]
-        }
+        v2_manifest.components = {"instructions": _instruction_refs(instruction_files)}
 
     manifest_path = output_path / "devsync-package.yaml"
-    manifest_path.write_text(v2_manifest.to_yaml())
+    manifest_path.write_bytes(v2_manifest.to_yaml_bytes())
 
     mode = "[green]AI-powered[/green]" if result.ai_powered else "[yellow]file-copy[/yellow]"
     console.print(f"\nUpgraded ({mode}):")
@@ -383,12 +395,73 @@ def _upgrade_v1_package(
     return 0
 
 
+def _instruction_refs(source_files: Iterable[str]) -> list[ComponentRef]:
+    """Build the instructions component refs for files copied into ``instructions/``."""
+    refs = []
+    for source_file in source_files:
+        path = Path(source_file)
+        refs.append(ComponentRef(name=path.stem, file=f"instructions/{path.name}"))
+    return refs
+
+
+def _read_if_small(path: Path, limit: int = _MAX_INSTRUCTION_BYTES) -> Optional[str]:
+    """Read a UTF-8 text file with a single open, skipping missing or oversized files.
+
+    Args:
+        path: File to read.
+        limit: Files of this many bytes or more are skipped.
+
+    Returns:
+        The file content with universal newlines, or None if the file does not
+        exist or is too large.
+
+    Raises:
+        OSError: If the file exists but cannot be read.
+        UnicodeDecodeError: If the file is not valid UTF-8.
+    """
+    try:
+        f = open(path, "rb")
+    except FileNotFoundError:
+        return None
+    with f:
+        if f.seek(0, os.SEEK_END) >= limit:
+            return None
+        f.seek(0)
+        data = f.read()
+    text = data.decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
 def _copy_source_files(project_path: Path, output_path: Path, source_files: list[str]) -> None:
-    """Copy source instruction files to the output package directory."""
+    """Copy source instruction files to the output package directory.
+
+    Only file contents are copied (the package directory is freshly built,
+    so source metadata is not preserved), and copies run concurrently.
+    """
     instructions_dir = output_path / "instructions"
-    instructions_dir.mkdir(parents=True, exist_ok=True)
+    ensure_directory_exists(instructions_dir)
+
+    # Grouped by destination: the last source that exists wins, as it would copying in order.
+    copies: dict[Path, list[Path]] = {}
     for rel_path in source_files:
-        src = project_path / rel_path
-        if src.exists():
-            dest = instructions_dir / Path(rel_path).name
-            shutil.copy2(str(src), str(dest))
+        copies.setdefault(instructions_dir / Path(rel_path).name, []).append(project_path / rel_path)
+
+    if len(copies) <= 1:
+        for dest, srcs in copies.items():
+            _copy_last_present(srcs, dest)
+        return
+
+    with ThreadPoolExecutor(max_workers=min(_MAX_IO_WORKERS, len(copies))) as executor:
+        list(executor.map(_copy_last_present, copies.values(), copies.keys()))
+
+
+def _copy_last_present(srcs: list[Path], dest: Path) -> None:
+    """Copy the last of ``srcs`` that exists to ``dest``; missing sources are skipped."""
+    for src in reversed(srcs):
+        try:
+            shutil.copyfile(src, dest)
+            return
+        except FileNotFoundError:
+            continue
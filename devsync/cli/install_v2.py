@@ -2,28 +2,45 @@
 
 from __future__ import annotations
 
+import os
 import shutil
 import tempfile
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING, Optional
 
+# The AI, prompt and MCP modules are imported where they are used so the
+# common file-copy install does not pay their import cost at startup.
 if TYPE_CHECKING:
     from devsync.core.practice import MCPDeclaration
+    from devsync.llm.response_models import AdaptationPlan
 
 from rich.console import Console
-from rich.prompt import Confirm
-from rich.table import Table
-
-from devsync.core.adapter import PracticeAdapter
-from devsync.core.mcp_credential_prompter import build_mcp_config, prompt_mcp_credentials
-from devsync.core.package_manifest_v2 import PackageManifestV2, detect_manifest_format, parse_manifest
-from devsync.llm.config import load_config
-from devsync.llm.provider import resolve_provider
-from devsync.llm.response_models import AdaptationPlan
+
+from devsync.core.package_manifest_v2 import PackageManifestV2, load_manifest
+from devsync.utils.paths import ensure_directory_exists
 from devsync.utils.project import find_project_root
 
 console = Console()
 
+# Upper bound on threads used to write instruction files
+_MAX_WRITE_WORKERS = 16
+
+# Rich style for each adaptation action in the plan table
+_ACTION_STYLES = {"install": "green", "merge": "yellow", "skip": "dim"}
+
+# Instruction directory and file extension per AI tool
+_TOOL_INSTRUCTION_PATHS: dict[str, tuple[str, str]] = {
+    "claude": (".claude/rules", ".md"),
+    "cursor": (".cursor/rules", ".mdc"),
+    "windsurf": (".windsurf/rules", ".md"),
+    "copilot": (".github/instructions", ".md"),
+    "kiro": (".kiro/steering", ".md"),
+    "cline": (".clinerules", ".md"),
+    "roo": (".roo/rules", ".md"),
+}
+
 
 def install_v2_command(
     source: str,
@@ -64,13 +81,12 @@ def install_v2_command(
         cloned_tmp = package_path
 
     try:
-        fmt = detect_manifest_format(package_path)
-        if not fmt:
+        fmt, manifest = load_manifest(package_path)
+        if not fmt or manifest is None:
             console.print(f"[red]No manifest found in {package_path}[/red]")
             console.print("Expected: devsync-package.yaml or ai-config-kit-package.yaml")
             return 1
 
-        manifest = parse_manifest(package_path)
         target_tools = _resolve_tools(tool)
 
         console.print(f"\n[bold]Installing: {manifest.name} v{manifest.version}[/bold]")
@@ -107,7 +123,7 @@ def _clone_source(url: str) -> Optional[Path]:
         from devsync.core.git_operations import GitOperations
 
         tmp_dir = Path(tempfile.mkdtemp(prefix="devsync-"))
-        GitOperations.clone_repository(url, tmp_dir)
+        GitOperations.clone_repository(url, tmp_dir, depth=1, no_tags=True)
         return tmp_dir
     except Exception as e:
         console.print(f"[red]Failed to clone {url}: {e}[/red]")
@@ -135,11 +151,21 @@ def _install_v2_ai(
     skip_pip: bool = False,
 ) -> int:
     """Install using AI-powered adaptation."""
+    from rich.prompt import Confirm
+
+    from devsync.core.adapter import PracticeAdapter
+    from devsync.llm.config import load_config
+    from devsync.llm.provider import resolve_provider
+
     config = load_config()
     llm = resolve_provider(preferred_provider=config.provider, preferred_model=config.model)
 
     adapter = PracticeAdapter(llm_provider=llm)
-    plan = adapter.adapt(manifest.practices, project_root, target_tools)
+    try:
+        plan = adapter.adapt(manifest.practices, project_root, target_tools)
+    finally:
+        if llm:
+            llm.close()
 
     _display_plan(plan)
 
@@ -166,52 +192,59 @@ def _install_v2_fallback(
 ) -> int:
     """Install using file-copy mode (v1 compat or --no-ai)."""
     installed_count = 0
+    # Planned writes count as existing files so conflicts resolve as if written in order
+    writes: dict[Path, str] = {}
+    messages: list[str] = []
 
+    def exists(path: Path) -> bool:
+        return path in writes or path.exists()
+
+    tool_dirs = _tool_instruction_dirs(project_root, target_tools)
+    pkg_resolved = package_path.resolve()
     for component_type, refs in manifest.components.items():
         if component_type != "instructions":
             continue
         for ref in refs:
-            src_file = (package_path / ref.file).resolve()
+            src_file = (pkg_resolved / ref.file).resolve()
+            if not src_file.is_relative_to(pkg_resolved):
+                messages.append(f"  [red]Rejected (path traversal): {ref.file}[/red]")
+                continue
             try:
-                src_file.relative_to(package_path.resolve())
-            except ValueError:
-                console.print(f"  [red]Rejected (path traversal): {ref.file}[/red]")
+                content = src_file.read_text(encoding="utf-8")
+            except FileNotFoundError:
+                messages.append(f"  [yellow]Missing: {ref.file}[/yellow]")
                 continue
-            if not src_file.exists():
-                console.print(f"  [yellow]Missing: {ref.file}[/yellow]")
+            if not _is_safe_instruction_name(ref.name):
                 continue
-
-            content = src_file.read_text(encoding="utf-8")
-            for tool_name in target_tools:
-                dest = _get_tool_instruction_path(tool_name, project_root, ref.name)
-                if not dest:
-                    continue
-                if dest.exists():
+            for tool_dir, ext in tool_dirs:
+                dest = tool_dir / f"{ref.name}{ext}"
+                if exists(dest):
                     if conflict == "skip":
-                        console.print(f"  [dim]Skipped (exists): {ref.name} → {dest.relative_to(project_root)}[/dim]")
+                        messages.append(f"  [dim]Skipped (exists): {ref.name} → {dest.relative_to(project_root)}[/dim]")
                         continue
                     elif conflict == "overwrite":
-                        dest.write_text(content, encoding="utf-8")
+                        writes[dest] = content
                         installed_count += 1
-                        console.print(f"  Overwritten: {ref.name} → {dest.relative_to(project_root)}")
+                        messages.append(f"  Overwritten: {ref.name} → {dest.relative_to(project_root)}")
                     elif conflict == "rename":
                         suffix = 1
                         renamed = dest.with_stem(f"{dest.stem}-{suffix}")
-                        while renamed.exists():
+                        while exists(renamed):
                             suffix += 1
                             renamed = dest.with_stem(f"{dest.stem}-{suffix}")
-                        renamed.parent.mkdir(parents=True, exist_ok=True)
-                        renamed.write_text(content, encoding="utf-8")
+                        writes[renamed] = content
                         installed_count += 1
-                        console.print(f"  Installed (renamed): {ref.name} → {renamed.relative_to(project_root)}")
+                        messages.append(f"  Installed (renamed): {ref.name} → {renamed.relative_to(project_root)}")
                     else:
                         rel = dest.relative_to(project_root)
-                        console.print(f"  [yellow]Exists: {ref.name} → {rel} (skipped)[/yellow]")
+                        messages.append(f"  [yellow]Exists: {ref.name} → {rel} (skipped)[/yellow]")
                 else:
-                    dest.parent.mkdir(parents=True, exist_ok=True)
-                    dest.write_text(content, encoding="utf-8")
+                    writes[dest] = content
                     installed_count += 1
-                    console.print(f"  Installed: {ref.name} → {dest.relative_to(project_root)}")
+                    messages.append(f"  Installed: {ref.name} → {dest.relative_to(project_root)}")
+
+    _write_files(writes)
+    _print_lines(messages)
 
     if manifest.mcp_servers:
         _install_mcp_servers(manifest, project_root, skip_pip=skip_pip)
@@ -222,49 +255,102 @@ def _install_v2_fallback(
 
 def _display_plan(plan: AdaptationPlan) -> None:
     """Display the adaptation plan for user review."""
+    from rich.table import Table
+
     table = Table(title="Adaptation Plan")
     table.add_column("Practice", style="cyan")
     table.add_column("Action", style="bold")
     table.add_column("Reason")
 
+    # Tally while building the rows instead of re-filtering the plan per action type
+    counts: Counter[str] = Counter()
     for action in plan.actions:
-        style = {"install": "green", "merge": "yellow", "skip": "dim"}.get(action.action, "")
+        style = _ACTION_STYLES.get(action.action, "")
         table.add_row(action.practice_name, f"[{style}]{action.action}[/{style}]", action.reason)
+        counts[action.action] += 1
 
     console.print(table)
-    console.print(f"\n  Install: {len(plan.installs)} | Merge: {len(plan.merges)} | Skip: {len(plan.skips)}")
+    console.print(f"\n  Install: {counts['install']} | Merge: {counts['merge']} | Skip: {counts['skip']}")
 
 
 def _execute_plan(plan: AdaptationPlan, project_root: Path, target_tools: list[str]) -> None:
     """Execute the adaptation plan — write files to tool-specific directories."""
+    writes: dict[Path, str] = {}
+    messages: list[str] = []
+    tool_dirs = _tool_instruction_dirs(project_root, target_tools)
     for action in plan.actions:
-        if action.action == "skip":
+        if action.action == "skip" or not _is_safe_instruction_name(action.practice_name):
             continue
-        for tool_name in target_tools:
-            dest = _get_tool_instruction_path(tool_name, project_root, action.practice_name)
-            if dest:
-                dest.parent.mkdir(parents=True, exist_ok=True)
-                dest.write_text(action.content, encoding="utf-8")
-                console.print(f"  Installed: {action.practice_name} → {dest.relative_to(project_root)}")
+        for tool_dir, ext in tool_dirs:
+            dest = tool_dir / f"{action.practice_name}{ext}"
+            writes[dest] = action.content
+            messages.append(f"  Installed: {action.practice_name} → {dest.relative_to(project_root)}")
 
+    _write_files(writes)
+    _print_lines(messages)
 
-def _get_tool_instruction_path(tool_name: str, project_root: Path, instruction_name: str) -> Optional[Path]:
-    """Get the file path for an instruction in a specific tool."""
-    if ".." in instruction_name or "/" in instruction_name or "\\" in instruction_name:
-        return None
-    tool_paths: dict[str, tuple[str, str]] = {
-        "claude": (".claude/rules", ".md"),
-        "cursor": (".cursor/rules", ".mdc"),
-        "windsurf": (".windsurf/rules", ".md"),
-        "copilot": (".github/instructions", ".md"),
-        "kiro": (".kiro/steering", ".md"),
-        "cline": (".clinerules", ".md"),
-        "roo": (".roo/rules", ".md"),
-    }
-    if tool_name not in tool_paths:
-        return None
-    dir_name, ext = tool_paths[tool_name]
-    return project_root / dir_name / f"{instruction_name}{ext}"
+
+def _print_lines(lines: list[str]) -> None:
+    """Print status lines with a single console call.
+
+    One print parses markup and writes to the terminal once, rather than
+    once per installed file.
+    """
+    if lines:
+        console.print("\n".join(lines))
+
+
+def _write_files(writes: dict[Path, str]) -> None:
+    """Write files concurrently, creating each parent directory once.
+
+    Content shared by several destinations (one practice installed for
+    several tools) is encoded once and the same bytes are written to each.
+    Newlines are translated to the platform convention, as a text-mode write
+    would.
+
+    Args:
+        writes: Mapping of destination path to UTF-8 text content. Each path
+            appears once, so concurrent writes never race on the same file.
+    """
+    for directory in {dest.parent for dest in writes}:
+        ensure_directory_exists(directory)
+
+    encoded: dict[str, bytes] = {}
+    jobs: list[tuple[Path, bytes]] = []
+    for dest, content in writes.items():
+        data = encoded.get(content)
+        if data is None:
+            text = content if os.linesep == "\n" else content.replace("\n", os.linesep)
+            data = encoded[content] = text.encode("utf-8")
+        jobs.append((dest, data))
+
+    if len(jobs) <= 1:
+        for dest, data in jobs:
+            dest.write_bytes(data)
+        return
+
+    with ThreadPoolExecutor(max_workers=min(_MAX_WRITE_WORKERS, len(jobs))) as pool:
+        # Consume the iterator so the first write error propagates
+        list(pool.map(lambda job: job[0].write_bytes(job[1]), jobs))
+
+
+def _tool_instruction_dirs(project_root: Path, target_tools: list[str]) -> list[tuple[Path, str]]:
+    """Resolve each known target tool to its (instruction directory, extension) pair.
+
+    Unknown tools are dropped. Built once per install so the per-instruction
+    loop only has to append a file name.
+    """
+    dirs = []
+    for tool in target_tools:
+        dir_ext = _TOOL_INSTRUCTION_PATHS.get(tool)
+        if dir_ext is not None:
+            dirs.append((project_root / dir_ext[0], dir_ext[1]))
+    return dirs
+
+
+def _is_safe_instruction_name(instruction_name: str) -> bool:
+    """Reject names that could escape the tool's instruction directory."""
+    return not (".." in instruction_name or "/" in instruction_name or "\\" in instruction_name)
 
 
 def _install_mcp_servers(
@@ -273,6 +359,8 @@ def _install_mcp_servers(
     skip_pip: bool = False,
 ) -> None:
     """Install MCP server configurations with pip dependencies and credential prompting."""
+    from devsync.core.mcp_credential_prompter import build_mcp_config, prompt_mcp_credentials
+
     failed_pip_servers = _install_pip_dependencies(manifest.mcp_servers, skip_pip=skip_pip)
 
     # Skip credential prompting for servers whose pip deps failed
@@ -282,13 +370,14 @@ def _install_mcp_servers(
         env_path = project_root / ".devsync" / ".env"
         credentials = prompt_mcp_credentials(servers_with_creds, env_path=env_path)
 
+        lines = []
         for server in eligible_servers:
             server_creds = credentials.get(server.name, {})
             build_mcp_config(server, server_creds)
-            console.print(f"  MCP: {server.name} configured")
+            lines.append(f"  MCP: {server.name} configured")
+        _print_lines(lines)
     else:
-        for server in eligible_servers:
-            console.print(f"  MCP: {server.name} (no credentials needed)")
+        _print_lines([f"  MCP: {server.name} (no credentials needed)" for server in eligible_servers])
 
 
 def _install_pip_dependencies(
@@ -304,9 +393,12 @@ def _install_pip_dependencies(
     Returns:
         Set of server names whose pip dependency installation failed or was declined.
     """
+    from rich.prompt import Confirm
+
     from devsync.core.pip_utils import (
         get_installed_version,
         install_pip_package,
+        install_pip_packages,
         installed_version_satisfies,
         validate_pip_spec,
     )
@@ -324,6 +416,7 @@ def _install_pip_dependencies(
             console.print(f"  [dim]{server.name}: {server.pip_package} (skipped)[/dim]")
         return failed_servers
 
+    approved: list[tuple[MCPDeclaration, str]] = []
     for server in servers_with_pip:
         spec = server.pip_package
         assert spec is not None  # guarded by servers_with_pip filter
@@ -347,8 +440,26 @@ def _install_pip_dependencies(
             failed_servers.add(server.name)
             continue
 
-        with console.status(f"  Installing {spec}..."):
-            success, message = install_pip_package(spec)
+        approved.append((server, spec))
+
+    if not approved:
+        return failed_servers
+
+    # Resolve and install every approved spec in one pip run; if that fails,
+    # retry one by one so each server gets its own result.
+    results: dict[str, tuple[bool, str]] = {}
+    specs = list(dict.fromkeys(spec for _, spec in approved))
+    if len(specs) > 1:
+        with console.status(f"  Installing {len(specs)} packages..."):
+            batch_success, _ = install_pip_packages(specs)
+        if batch_success:
+            results = {spec: (True, f"Successfully installed {spec}") for spec in specs}
+
+    for server, spec in approved:
+        if spec not in results:
+            with console.status(f"  Installing {spec}..."):
+                results[spec] = install_pip_package(spec)
+        success, message = results[spec]
 
         if success:
             console.print(f"  [green]{message}[/green]")
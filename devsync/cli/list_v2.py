@@ -1,6 +1,7 @@
 """Simplified list command for v2."""
 
 import json as json_module
+import sys
 from pathlib import Path
 from typing import Optional
 
@@ -12,6 +13,8 @@ from devsync.utils.project import find_project_root
 
 console = Console()
 
+_STATUS_STYLES = {"installed": "green", "COMPLETE": "green"}
+
 
 def list_v2_command(
     tool: Optional[str] = None,
@@ -39,21 +42,20 @@ def list_v2_command(
 
     if not packages:
         if json:
-            console.print("[]")
+            sys.stdout.write("[]\n")
         else:
             console.print("[dim]No packages installed in this project.[/dim]")
             console.print("Use [cyan]devsync install <source>[/cyan] to install packages.")
         return 0
 
     if tool:
-        packages = [p for p in packages if _package_has_tool(p, tool)]
+        tool_lower = tool.lower()
+        packages = [p for p in packages if _package_has_tool(p, tool_lower)]
 
     if json:
-        output = []
-        for pkg in packages:
-            pkg_dict = pkg.to_dict() if hasattr(pkg, "to_dict") else {"name": str(pkg)}
-            output.append(pkg_dict)
-        console.print(json_module.dumps(output, indent=2))
+        output = [pkg.to_dict() if hasattr(pkg, "to_dict") else {"name": str(pkg)} for pkg in packages]
+        # Bypass Rich: it would scan the payload for markup and wrap long lines
+        sys.stdout.write(json_module.dumps(output, indent=2) + "\n")
         return 0
 
     table = Table(title="Installed Packages")
@@ -68,7 +70,7 @@ def list_v2_command(
         components = getattr(pkg, "components", [])
         component_count = len(components) if isinstance(components, list) else 0
         status = getattr(pkg, "status", "installed")
-        status_style = "green" if status == "installed" or status == "COMPLETE" else "yellow"
+        status_style = _STATUS_STYLES.get(status, "yellow")
 
         table.add_row(
             name,
@@ -82,11 +84,16 @@ def list_v2_command(
 
 
 def _package_has_tool(pkg: object, tool_name: str) -> bool:
-    """Check if a package has components for a specific tool."""
+    """Check if a package has components for a specific tool.
+
+    Args:
+        pkg: Installed package record.
+        tool_name: Tool name, already lowercased by the caller.
+    """
     components = getattr(pkg, "components", [])
     if isinstance(components, list):
         for comp in components:
             comp_tool = getattr(comp, "ai_tool", None) or getattr(comp, "tool", None)
-            if comp_tool and str(comp_tool).lower() == tool_name.lower():
+            if comp_tool and str(comp_tool).lower() == tool_name:
                 return True
     return False
@@ -50,7 +50,11 @@ def setup_command() -> int:
     provider = resolve_provider(preferred_provider=provider_name, preferred_model=model)
     if provider:
         console.print("Validating API key...", end=" ")
-        if provider.validate_api_key():
+        try:
+            valid = provider.validate_api_key()
+        finally:
+            provider.close()
+        if valid:
             console.print("[green]valid[/green]")
         else:
             console.print("[red]invalid[/red]")
@@ -2,30 +2,76 @@
 
 import json
 import logging
+import os
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional, TypeVar
 
 from devsync.core.practice import PracticeDeclaration
-from devsync.llm.prompts import ADAPT_PRACTICE_PROMPT, SYSTEM_PROMPT
+from devsync.llm.prompts import ADAPT_PRACTICE_PROMPT, ADAPT_PRACTICES_BATCH_PROMPT, SYSTEM_PROMPT
 from devsync.llm.provider import LLMProvider, LLMProviderError
 from devsync.llm.response_models import (
     AdaptationAction,
     AdaptationPlan,
     parse_adaptation_response,
+    parse_batch_adaptation_response,
 )
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+DEFAULT_BATCH_SIZE = 8
+DEFAULT_MAX_CONCURRENCY = 4
+_BATCH_MAX_TOKENS = 16384
+
+_MAX_READ_WORKERS = 16
+# Only the start of each existing rule file goes into the adaptation prompt
+_RULE_EXCERPT_CHARS = 500
+# Stored with the native separator so relative keys need no re-parsing
+_RULE_DIRS = tuple(
+    os.path.normpath(d)
+    for d in (
+        ".cursor/rules",
+        ".claude/rules",
+        ".windsurf/rules",
+        ".github/instructions",
+        ".kiro/steering",
+        ".clinerules",
+        ".roo/rules",
+    )
+)
+
+
+def _read_rule(path: str) -> Optional[str]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            return f.read(_RULE_EXCERPT_CHARS)
+    except (OSError, UnicodeDecodeError):
+        return None
+
 
 class PracticeAdapter:
     """Adapts incoming practices to a target project's existing setup.
 
     Uses LLM intelligence for semantic merging when available,
-    falls back to standard conflict resolution otherwise.
+    falls back to standard conflict resolution otherwise. Practices are
+    sent to the LLM in batches of ``batch_size`` per request, with at most
+    ``max_concurrency`` requests in flight.
     """
 
-    def __init__(self, llm_provider: Optional[LLMProvider] = None):
+    def __init__(
+        self,
+        llm_provider: Optional[LLMProvider] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ):
         self._llm = llm_provider
+        self._batch_size = max(1, batch_size)
+        self._max_concurrency = max(1, max_concurrency)
 
     def adapt(
         self,
@@ -50,29 +96,33 @@ class PracticeAdapter:
         return self._adapt_without_ai(practices, existing_rules, target_tools)
 
     def _detect_existing_rules(self, project_path: Path) -> dict[str, str]:
-        """Detect existing instruction files in the target project."""
-        rules: dict[str, str] = {}
-        rule_dirs = [
-            ".cursor/rules",
-            ".claude/rules",
-            ".windsurf/rules",
-            ".github/instructions",
-            ".kiro/steering",
-            ".clinerules",
-            ".roo/rules",
-        ]
-        for rule_dir in rule_dirs:
-            dir_path = project_path / rule_dir
-            if dir_path.is_dir():
-                for f in dir_path.iterdir():
-                    if f.is_file() and f.suffix in (".md", ".mdc"):
-                        try:
-                            content = f.read_text(encoding="utf-8")
-                            rel_path = str(f.relative_to(project_path))
-                            rules[rel_path] = content
-                        except (OSError, UnicodeDecodeError):
-                            pass
-        return rules
+        """Detect existing instruction files in the target project.
+
+        Rule directories are listed first, then all candidate files are read
+        concurrently; the result keeps directory listing order. Only the first
+        ``_RULE_EXCERPT_CHARS`` characters of each file are read, since that
+        is all the adaptation prompt uses.
+        """
+        root = str(project_path)
+        candidates: list[str] = []
+        rel_paths: list[str] = []
+        for rule_dir in _RULE_DIRS:
+            try:
+                with os.scandir(os.path.join(root, rule_dir)) as entries:
+                    for entry in entries:
+                        if entry.name.endswith((".md", ".mdc")) and entry.is_file():
+                            candidates.append(entry.path)
+                            rel_paths.append(os.path.join(rule_dir, entry.name))
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+
+        if len(candidates) > 1:
+            with ThreadPoolExecutor(max_workers=min(_MAX_READ_WORKERS, len(candidates))) as executor:
+                contents = list(executor.map(_read_rule, candidates))
+        else:
+            contents = [_read_rule(f) for f in candidates]
+
+        return {rel: content for rel, content in zip(rel_paths, contents) if content is not None}
 
     def _adapt_with_ai(
         self,
@@ -80,42 +130,120 @@ class PracticeAdapter:
         existing_rules: dict[str, str],
         target_tools: list[str],
     ) -> AdaptationPlan:
-        """Use LLM to create semantic adaptation plan."""
-        assert self._llm is not None
-        actions: list[AdaptationAction] = []
-        existing_summary = "\n".join(f"--- {path} ---\n{content[:500]}" for path, content in existing_rules.items())
+        """Use LLM to create semantic adaptation plan.
 
-        for practice in practices:
-            try:
-                prompt = ADAPT_PRACTICE_PROMPT.format(
-                    practice_json=json.dumps(practice.to_dict(), indent=2),
-                    existing_rules=existing_summary,
-                    tool_name=", ".join(target_tools),
-                )
-                response = self._llm.complete(prompt, system=SYSTEM_PROMPT)
-                action = parse_adaptation_response(response.content)
-                action.practice_name = practice.name
-
-                if action.action == "install" and not action.content:
-                    action.content = self._render_practice(practice)
-                if not action.file_name:
-                    action.file_name = f"{practice.name}.md"
-
-                actions.append(action)
-            except (LLMProviderError, ValueError) as e:
-                logger.warning("AI adaptation failed for %s: %s", practice.name, e)
-                actions.append(
-                    AdaptationAction(
-                        action="install",
-                        practice_name=practice.name,
-                        reason="AI adaptation failed, installing as-is",
-                        file_name=f"{practice.name}.md",
-                        content=self._render_practice(practice),
-                    )
-                )
+        Batched requests run concurrently, then every practice the batches did
+        not cover is retried with its own request, also concurrently. Actions
+        keep the order of ``practices``.
+        """
+        existing_summary = "\n".join(
+            f"--- {path} ---\n{content[:_RULE_EXCERPT_CHARS]}" for path, content in existing_rules.items()
+        )
+        tool_name = ", ".join(target_tools)
+
+        batches = [practices[i : i + self._batch_size] for i in range(0, len(practices), self._batch_size)]
+        replies = self._map_concurrent(lambda batch: self._request_batch(batch, existing_summary, tool_name), batches)
+
+        pending = [p for batch, reply in zip(batches, replies) for p in batch if p.name not in reply]
+        singles = self._map_concurrent(lambda p: self._adapt_single(p, existing_summary, tool_name), pending)
+        single_iter = iter(singles)
+
+        actions: list[AdaptationAction] = []
+        for batch, reply in zip(batches, replies):
+            for practice in batch:
+                if practice.name in reply:
+                    actions.append(self._complete_action(replace(reply[practice.name]), practice))
+                else:
+                    actions.append(next(single_iter))
 
         return AdaptationPlan(actions=actions, target_tools=target_tools, ai_powered=True)
 
+    def _map_concurrent(self, fn: Callable[[_T], _R], items: list[_T]) -> list[_R]:
+        """Apply ``fn`` to each item on a bounded thread pool, preserving order."""
+        if len(items) <= 1:
+            return [fn(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(self._max_concurrency, len(items))) as executor:
+            return list(executor.map(fn, items))
+
+    def _request_batch(
+        self,
+        batch: list[PracticeDeclaration],
+        existing_summary: str,
+        tool_name: str,
+    ) -> dict[str, AdaptationAction]:
+        """Adapt a batch of practices with one LLM request.
+
+        Returns:
+            Parsed actions keyed by practice name. Empty for single-practice
+            batches (they go straight to the single-practice prompt) and when
+            the batched request fails. Names that are not unique, either in
+            the batch or in the reply, are left out so those practices are
+            retried with their own request instead of sharing one action.
+        """
+        assert self._llm is not None
+        by_name: dict[str, AdaptationAction] = {}
+        if len(batch) == 1:
+            return by_name
+
+        try:
+            prompt = ADAPT_PRACTICES_BATCH_PROMPT.format(
+                practices_json=json.dumps([p.to_dict() for p in batch], indent=2),
+                existing_rules=existing_summary,
+                tool_name=tool_name,
+            )
+            response = self._llm.complete(prompt, system=SYSTEM_PROMPT, max_tokens=_BATCH_MAX_TOKENS)
+            parsed_actions = parse_batch_adaptation_response(response.content)
+            self._llm.confirm_response(response)
+        except (LLMProviderError, ValueError) as e:
+            logger.warning("Batched AI adaptation failed, retrying per practice: %s", e)
+            return by_name
+
+        ambiguous = {name for name, count in Counter(p.name for p in batch).items() if count > 1}
+        for parsed in parsed_actions:
+            if parsed.practice_name in by_name:
+                ambiguous.add(parsed.practice_name)
+            by_name[parsed.practice_name] = parsed
+        for name in ambiguous:
+            by_name.pop(name, None)
+        return by_name
+
+    def _adapt_single(
+        self,
+        practice: PracticeDeclaration,
+        existing_summary: str,
+        tool_name: str,
+    ) -> AdaptationAction:
+        """Adapt one practice with its own LLM request."""
+        assert self._llm is not None
+        try:
+            prompt = ADAPT_PRACTICE_PROMPT.format(
+                practice_json=json.dumps(practice.to_dict(), indent=2),
+                existing_rules=existing_summary,
+                tool_name=tool_name,
+            )
+            response = self._llm.complete(prompt, system=SYSTEM_PROMPT)
+            action = parse_adaptation_response(response.content)
+            self._llm.confirm_response(response)
+            return self._complete_action(action, practice)
+        except (LLMProviderError, ValueError) as e:
+            logger.warning("AI adaptation failed for %s: %s", practice.name, e)
+            return AdaptationAction(
+                action="install",
+                practice_name=practice.name,
+                reason="AI adaptation failed, installing as-is",
+                file_name=f"{practice.name}.md",
+                content=self._render_practice(practice),
+            )
+
+    def _complete_action(self, action: AdaptationAction, practice: PracticeDeclaration) -> AdaptationAction:
+        """Fill in the fields an LLM response may leave out."""
+        action.practice_name = practice.name
+        if action.action == "install" and not action.content:
+            action.content = self._render_practice(practice)
+        if not action.file_name:
+            action.file_name = f"{practice.name}.md"
+        return action
+
     def _adapt_without_ai(
         self,
         practices: list[PracticeDeclaration],
@@ -155,27 +283,11 @@ class PracticeAdapter:
         if practice.raw_content:
             return practice.raw_content
 
-        lines = [f"# {practice.name}", "", practice.intent, ""]
-
+        parts = [f"# {practice.name}\n\n{practice.intent}\n"]
         if practice.principles:
-            lines.append("## Principles")
-            lines.append("")
-            for p in practice.principles:
-                lines.append(f"- {p}")
-            lines.append("")
-
+            parts.append("\n## Principles\n\n" + "".join(f"- {p}\n" for p in practice.principles))
         if practice.enforcement_patterns:
-            lines.append("## Enforcement")
-            lines.append("")
-            for e in practice.enforcement_patterns:
-                lines.append(f"- {e}")
-            lines.append("")
-
+            parts.append("\n## Enforcement\n\n" + "".join(f"- {e}\n" for e in practice.enforcement_patterns))
         if practice.examples:
-            lines.append("## Examples")
-            lines.append("")
-            for ex in practice.examples:
-                lines.append(f"```\n{ex}\n```")
-                lines.append("")
-
-        return "\n".join(lines)
+            parts.append("\n## Examples\n\n" + "\n".join(f"```\n{ex}\n```\n" for ex in practice.examples))
+        return "".join(parts)
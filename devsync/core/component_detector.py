@@ -4,7 +4,7 @@ import json
 import logging
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 from devsync.core.checksum import calculate_file_checksum
 from devsync.core.models import (
@@ -19,6 +19,9 @@ from devsync.core.models import (
     WorkflowComponent,
 )
 
+if TYPE_CHECKING:
+    from devsync.core.pip_utils import DistributionIndex
+
 logger = logging.getLogger(__name__)
 
 
@@ -344,6 +347,8 @@ class ComponentDetector:
         self.project_root = project_root.resolve()
         self.scope = scope
         self.tool_filter = tool_filter
+        # Built on first pip lookup so every MCP server in a scan shares it
+        self._distribution_index: Optional["DistributionIndex"] = None
 
     def _get_registry_entries(self) -> list[tuple[str, Any]]:
         """Get registry entries filtered by tool_filter.
@@ -570,9 +575,11 @@ class ComponentDetector:
         """
         if not command:
             return None
-        from devsync.core.pip_utils import resolve_pip_package_for_command
+        from devsync.core.pip_utils import DistributionIndex, resolve_pip_package_for_command
 
-        return resolve_pip_package_for_command(command, args)
+        if self._distribution_index is None:
+            self._distribution_index = DistributionIndex()
+        return resolve_pip_package_for_command(command, args, self._distribution_index)
 
     def _detect_hooks(self) -> list[DetectedHook]:
         """Detect hook scripts from registry-derived paths.
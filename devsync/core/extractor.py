@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING, Optional
 
@@ -23,6 +24,8 @@ from devsync.llm.response_models import ExtractionResult, parse_extraction_respo
 
 logger = logging.getLogger(__name__)
 
+_MAX_CONCURRENT_REQUESTS = 4
+
 
 class PracticeExtractor:
     """Extracts practice declarations from a project's AI configs.
@@ -104,51 +107,66 @@ class PracticeExtractor:
         return configs
 
     def _extract_with_ai(self, files: dict[str, str], mcp_configs: list[dict]) -> ExtractionResult:
-        """Extract practices using LLM intelligence."""
+        """Extract practices using LLM intelligence.
+
+        The practice request and one request per MCP config are independent,
+        so they run concurrently; MCP servers keep the order of ``mcp_configs``.
+        """
         assert self._llm is not None
 
-        practices: list[PracticeDeclaration] = []
-        mcp_servers: list[MCPDeclaration] = []
-
-        if files:
-            files_content = format_files_for_extraction(files)
-            prompt = EXTRACT_PRACTICES_PROMPT.format(files_content=files_content)
-            try:
-                response = self._llm.complete(prompt, system=SYSTEM_PROMPT)
-                practices = parse_extraction_response(response.content)
-                for i, p in enumerate(practices):
-                    source_files = list(files.keys())
-                    if i < len(source_files):
-                        practices[i] = PracticeDeclaration(
-                            name=p.name,
-                            intent=p.intent,
-                            principles=p.principles,
-                            enforcement_patterns=p.enforcement_patterns,
-                            examples=p.examples,
-                            tags=p.tags,
-                            source_file=source_files[i] if i < len(source_files) else None,
-                        )
-            except (LLMProviderError, ValueError) as e:
-                logger.warning("AI extraction failed, falling back: %s", e)
-                practices = self._practices_from_files(files)
-
-        for mcp_config in mcp_configs:
-            try:
-                prompt = EXTRACT_MCP_PROMPT.format(mcp_config=json.dumps(mcp_config, indent=2))
-                response = self._llm.complete(prompt, system=SYSTEM_PROMPT)
-                content = _strip_markdown_fences(response.content)
-                data = json.loads(content)
-                mcp_servers.append(MCPDeclaration.from_dict(data))
-            except (LLMProviderError, ValueError, json.JSONDecodeError) as e:
-                logger.warning("MCP extraction failed for %s: %s", mcp_config.get("name", "unknown"), e)
+        with ThreadPoolExecutor(max_workers=max(1, min(_MAX_CONCURRENT_REQUESTS, len(mcp_configs) + 1))) as executor:
+            practices_future = executor.submit(self._extract_practices, files) if files else None
+            mcp_results = list(executor.map(self._extract_mcp_server, mcp_configs))
+            practices = practices_future.result() if practices_future else []
 
         return ExtractionResult(
             practices=practices,
-            mcp_servers=mcp_servers,
+            mcp_servers=[server for server in mcp_results if server is not None],
             source_files=list(files.keys()),
             ai_powered=True,
         )
 
+    def _extract_practices(self, files: dict[str, str]) -> list[PracticeDeclaration]:
+        """Extract practices from instruction files with one LLM request."""
+        assert self._llm is not None
+        files_content = format_files_for_extraction(files)
+        prompt = EXTRACT_PRACTICES_PROMPT.format(files_content=files_content)
+        try:
+            response = self._llm.complete(prompt, system=SYSTEM_PROMPT)
+            practices = parse_extraction_response(response.content)
+            self._llm.confirm_response(response)
+            for i, p in enumerate(practices):
+                source_files = list(files.keys())
+                if i < len(source_files):
+                    practices[i] = PracticeDeclaration(
+                        name=p.name,
+                        intent=p.intent,
+                        principles=p.principles,
+                        enforcement_patterns=p.enforcement_patterns,
+                        examples=p.examples,
+                        tags=p.tags,
+                        source_file=source_files[i] if i < len(source_files) else None,
+                    )
+            return practices
+        except (LLMProviderError, ValueError) as e:
+            logger.warning("AI extraction failed, falling back: %s", e)
+            return self._practices_from_files(files)
+
+    def _extract_mcp_server(self, mcp_config: dict) -> Optional[MCPDeclaration]:
+        """Extract one MCP server declaration, or None if the request fails."""
+        assert self._llm is not None
+        try:
+            prompt = EXTRACT_MCP_PROMPT.format(mcp_config=json.dumps(mcp_config, indent=2))
+            response = self._llm.complete(prompt, system=SYSTEM_PROMPT)
+            content = _strip_markdown_fences(response.content)
+            data = json.loads(content)
+            server = MCPDeclaration.from_dict(data)
+            self._llm.confirm_response(response)
+            return server
+        except (LLMProviderError, ValueError, json.JSONDecodeError) as e:
+            logger.warning("MCP extraction failed for %s: %s", mcp_config.get("name", "unknown"), e)
+            return None
+
     def _extract_without_ai(self, files: dict[str, str], mcp_configs: list[dict]) -> ExtractionResult:
         """Extract practices as literal file copies (no AI)."""
         practices = self._practices_from_files(files)
@@ -66,7 +66,11 @@ class GitOperations:
 
     @staticmethod
     def clone_repository(
-        repo_url: str, target_dir: Optional[Path] = None, branch: Optional[str] = None, depth: int = 1
+        repo_url: str,
+        target_dir: Optional[Path] = None,
+        branch: Optional[str] = None,
+        depth: int = 1,
+        no_tags: bool = False,
     ) -> Path:
         """
         Clone a Git repository or use a local directory.
@@ -76,6 +80,7 @@ class GitOperations:
             target_dir: Directory to clone into (creates temp dir if None)
             branch: Specific branch to clone (defaults to default branch)
             depth: Clone depth (1 for shallow clone)
+            no_tags: Skip fetching tags (for callers that only read the tip)
 
         Returns:
             Path to repository
@@ -110,6 +115,9 @@ class GitOperations:
         if depth > 0:
             cmd.extend(["--depth", str(depth)])
 
+        if no_tags:
+            cmd.append("--no-tags")
+
         # Add branch if specified
         if branch:
             cmd.extend(["--branch", branch])
@@ -129,6 +137,11 @@ class GitOperations:
                 shutil.rmtree(target_dir, ignore_errors=True)
 
             error_msg = e.stderr if e.stderr else str(e)
+
+            # Dumb HTTP and some older servers can't serve shallow clones; fall back to a full clone
+            if depth > 0 and "shallow" in error_msg.lower():
+                return GitOperations.clone_repository(repo_url, target_dir, branch=branch, depth=0, no_tags=no_tags)
+
             raise GitOperationError(f"Failed to clone repository: {error_msg}")
 
         except subprocess.TimeoutExpired:
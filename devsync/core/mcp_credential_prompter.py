@@ -1,6 +1,7 @@
 """MCP credential prompting for package installation."""
 
 import logging
+import os
 from pathlib import Path
 from typing import Optional
 
@@ -19,6 +20,12 @@ def prompt_mcp_credentials(
 ) -> dict[str, dict[str, str]]:
     """Prompt the user for MCP server credentials.
 
+    When a value is already known (entered earlier in this call, since
+    servers often share a credential, then saved in ``env_path``, then set in
+    the process environment) the prompt offers it as the default: pressing
+    Enter keeps it and typing a new value replaces it. Every value used is
+    written to ``env_path``.
+
     Args:
         mcp_servers: MCP server declarations with credential specs.
         env_path: Path to write .env file. If None, returns values without writing.
@@ -27,6 +34,8 @@ def prompt_mcp_credentials(
         Dict mapping server name → {env_var_name: value}.
     """
     all_credentials: dict[str, dict[str, str]] = {}
+    entered: dict[str, str] = {}
+    saved = _load_existing_credentials(env_path)
 
     for server in mcp_servers:
         if not server.credentials:
@@ -37,8 +46,10 @@ def prompt_mcp_credentials(
 
         server_creds: dict[str, str] = {}
         for cred in server.credentials:
-            value = _prompt_single_credential(cred)
+            found = _find_existing_credential(cred.name, entered, saved, env_path)
+            value = _prompt_single_credential(cred, found)
             if value:
+                entered[cred.name] = value
                 server_creds[cred.name] = value
 
         if server_creds:
@@ -50,11 +61,43 @@ def prompt_mcp_credentials(
     return all_credentials
 
 
-def _prompt_single_credential(cred: CredentialSpec) -> str:
+def _find_existing_credential(
+    name: str,
+    entered: dict[str, str],
+    saved: dict[str, str],
+    env_path: Optional[Path],
+) -> Optional[tuple[str, str]]:
+    """Look up a known value for ``name``.
+
+    Returns:
+        (value, where it was found) or None if no value is known.
+    """
+    if name in entered:
+        return entered[name], "entered above"
+    if name in saved:
+        return saved[name], str(env_path)
+    value = os.environ.get(name)
+    if value:
+        return value, "environment"
+    return None
+
+
+def _load_existing_credentials(env_path: Optional[Path]) -> dict[str, str]:
+    """Read credential values already saved in ``env_path``, if it exists."""
+    if env_path is None or not env_path.is_file():
+        return {}
+
+    from dotenv import dotenv_values
+
+    return {key: value for key, value in dotenv_values(env_path).items() if value}
+
+
+def _prompt_single_credential(cred: CredentialSpec, found: Optional[tuple[str, str]] = None) -> str:
     """Prompt for a single credential value.
 
     Args:
         cred: Credential specification.
+        found: Existing (value, source) to offer as the default, if any.
 
     Returns:
         The credential value entered by the user (empty string if skipped).
@@ -63,6 +106,12 @@ def _prompt_single_credential(cred: CredentialSpec) -> str:
     console.print(f"\n  {required_label} {cred.name}")
     console.print(f"  [dim]{cred.description}[/dim]")
 
+    if found:
+        existing, source = found
+        console.print(f"  [dim]Found a value ({source}). Press Enter to keep it or type a new one.[/dim]")
+        answer = Prompt.ask(f"  Enter {cred.name}", default=existing, show_default=False, password=True)
+        return answer.strip() or existing
+
     default = cred.default or ""
     if cred.required:
         while True:
@@ -84,15 +133,14 @@ def _write_env_file(env_path: Path, credentials: dict[str, dict[str, str]]) -> N
     """
     env_path.parent.mkdir(parents=True, exist_ok=True)
 
-    from devsync.utils.dotenv import ensure_env_gitignored, set_env_variable
+    from devsync.utils.dotenv import ensure_env_gitignored, set_env_variables
 
     ensure_env_gitignored(env_path)
 
-    for server_name, creds in credentials.items():
-        for var_name, value in creds.items():
-            if value:
-                set_env_variable(env_path, var_name, value)
-                logger.info("Wrote %s to %s", var_name, env_path)
+    variables = {var_name: value for creds in credentials.values() for var_name, value in creds.items() if value}
+    set_env_variables(env_path, variables)
+    for var_name in variables:
+        logger.info("Wrote %s to %s", var_name, env_path)
 
     console.print(f"\n[green]Credentials saved to {env_path}[/green]")
 
@@ -1060,6 +1060,11 @@ class SecretConfidence(Enum):
     MEDIUM = "medium"  # Prompt user
     SAFE = "safe"  # Preserve value
 
+    @property
+    def is_secret(self) -> bool:
+        """Whether values at this confidence should be templated."""
+        return self is SecretConfidence.HIGH or self is SecretConfidence.MEDIUM
+
 
 @dataclass
 class CredentialDescriptor:
@@ -15,6 +15,9 @@ from devsync.core.models import (
     ResourceComponent,
 )
 
+# Prefer the libyaml C bindings when PyYAML was built with them
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class ValidationError(Exception):
     """Raised when manifest validation fails."""
@@ -56,7 +59,7 @@ class PackageManifestParser:
             raise FileNotFoundError(f"Manifest not found: {self.manifest_path}")
 
         with open(self.manifest_path, "r") as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_YAML_LOADER)
 
         if not data:
             raise ValidationError("Manifest is empty")
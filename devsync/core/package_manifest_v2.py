@@ -11,6 +11,10 @@ from devsync.core.practice import CredentialSpec, MCPDeclaration, PracticeDeclar
 
 logger = logging.getLogger(__name__)
 
+# Prefer the libyaml C bindings when PyYAML was built with them
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 V2_MANIFEST_FILE = "devsync-package.yaml"
 V1_MANIFEST_FILE = "ai-config-kit-package.yaml"
 
@@ -121,7 +125,13 @@ class PackageManifestV2:
         return result
 
     def to_yaml(self) -> str:
-        return yaml.dump(self.to_dict(), default_flow_style=False, sort_keys=False)
+        return yaml.dump(self.to_dict(), Dumper=_YAML_DUMPER, default_flow_style=False, sort_keys=False)
+
+    def to_yaml_bytes(self) -> bytes:
+        """Serialize to UTF-8 YAML bytes, encoded by the emitter itself."""
+        return yaml.dump(
+            self.to_dict(), Dumper=_YAML_DUMPER, default_flow_style=False, sort_keys=False, encoding="utf-8"
+        )
 
 
 def detect_manifest_format(package_path: Path) -> Optional[str]:
@@ -134,11 +144,8 @@ def detect_manifest_format(package_path: Path) -> Optional[str]:
         'v2' if devsync-package.yaml exists, 'v1' if ai-config-kit-package.yaml exists,
         None if neither found.
     """
-    if (package_path / V2_MANIFEST_FILE).exists():
-        return "v2"
-    if (package_path / V1_MANIFEST_FILE).exists():
-        return "v1"
-    return None
+    found = _find_manifest_file(package_path)
+    return found[0] if found else None
 
 
 def parse_manifest(package_path: Path) -> PackageManifestV2:
@@ -154,18 +161,49 @@ def parse_manifest(package_path: Path) -> PackageManifestV2:
         FileNotFoundError: If no manifest file found.
         ValueError: If manifest is malformed.
     """
-    fmt = detect_manifest_format(package_path)
+    _, manifest = load_manifest(package_path)
+    if manifest is None:
+        raise FileNotFoundError(
+            f"No manifest found in {package_path} (expected {V2_MANIFEST_FILE} or {V1_MANIFEST_FILE})"
+        )
+    return manifest
+
+
+def load_manifest(package_path: Path) -> tuple[Optional[str], Optional[PackageManifestV2]]:
+    """Detect the manifest format and parse it in a single pass.
+
+    Args:
+        package_path: Root directory of the package.
+
+    Returns:
+        Tuple of ('v1' or 'v2', parsed manifest), or (None, None) if no manifest found.
+
+    Raises:
+        ValueError: If manifest is malformed.
+    """
+    found = _find_manifest_file(package_path)
+    if found is None:
+        return None, None
+
+    fmt, manifest_path = found
     if fmt == "v2":
-        return _parse_v2(package_path / V2_MANIFEST_FILE)
-    if fmt == "v1":
-        return _parse_v1(package_path / V1_MANIFEST_FILE)
-    raise FileNotFoundError(f"No manifest found in {package_path} (expected {V2_MANIFEST_FILE} or {V1_MANIFEST_FILE})")
+        return fmt, _parse_v2(manifest_path)
+    return fmt, _parse_v1(manifest_path)
+
+
+def _find_manifest_file(package_path: Path) -> Optional[tuple[str, Path]]:
+    """Locate the manifest file, checking each candidate at most once."""
+    for fmt, filename in (("v2", V2_MANIFEST_FILE), ("v1", V1_MANIFEST_FILE)):
+        manifest_path = package_path / filename
+        if manifest_path.exists():
+            return fmt, manifest_path
+    return None
 
 
 def _parse_v2(manifest_path: Path) -> PackageManifestV2:
     """Parse a v2 devsync-package.yaml manifest."""
     with open(manifest_path) as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=_YAML_LOADER)
 
     if not isinstance(data, dict):
         raise ValueError(f"Invalid manifest: expected dict, got {type(data).__name__}")
@@ -195,7 +233,7 @@ def _parse_v2(manifest_path: Path) -> PackageManifestV2:
 def _parse_v1(manifest_path: Path) -> PackageManifestV2:
     """Parse a v1 ai-config-kit-package.yaml manifest into the v2 structure."""
     with open(manifest_path) as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=_YAML_LOADER)
 
     if not isinstance(data, dict):
         raise ValueError(f"Invalid manifest: expected dict, got {type(data).__name__}")
@@ -6,28 +6,37 @@ install packages with comprehensive error handling.
 """
 
 import importlib.metadata
+import importlib.util
 import logging
 import os
 import re
 import shutil
 import subprocess
 import sys
-from typing import Optional
+from functools import lru_cache
+from typing import Mapping, Optional
 
 logger = logging.getLogger(__name__)
 
 # Allowlist pattern for pip package specs: name, name>=1.0, name[extra]==2.0, etc.
-# Rejects URLs, paths, and shell metacharacters.
+# Rejects URLs, paths, and shell metacharacters. Always applied with fullmatch().
 _PIP_SPEC_PATTERN = re.compile(
-    r"^[A-Za-z0-9]([A-Za-z0-9._-]*[A-Za-z0-9])?"  # package name
+    r"[A-Za-z0-9]([A-Za-z0-9._-]*[A-Za-z0-9])?"  # package name
     r"(\[[A-Za-z0-9,._-]+\])?"  # optional extras
     r"([<>=!~]+[A-Za-z0-9.*]+)?"  # optional version constraint
-    r"$"
 )
 
-_DANGEROUS_CHARS = set(";|&$`{}()\n\r")
+# Splits a spec at the first version operator or extras bracket
+_NAME_END_PATTERN = re.compile(r"[<>=!~\[]")
+# Version constraint at the end of a spec, e.g. ">=1.0" in "name>=1.0"
+_CONSTRAINT_PATTERN = re.compile(r"([<>=!~]+.+)$")
+_VERSIONED_PYTHON_PATTERN = re.compile(r"python3\.\d+$")
+_PYTHON_BASENAMES = frozenset({"python", "python3"})
 
+_DANGEROUS_CHARS = frozenset(";|&$`{}()\n\r")
 
+
+@lru_cache(maxsize=512)
 def validate_pip_spec(spec: str) -> bool:
     """Validate a pip package specifier against an allowlist.
 
@@ -38,26 +47,26 @@ def validate_pip_spec(spec: str) -> bool:
         spec: Pip package specifier string.
 
     Returns:
-        True if the spec is valid and safe.
+        True if the spec is valid and safe. Results are memoized, since the
+        same few specs recur across MCP declarations.
     """
-    if not spec or not spec.strip():
-        return False
-
     spec = spec.strip()
+    if not spec:
+        return False
 
-    if any(c in spec for c in _DANGEROUS_CHARS):
+    if not _DANGEROUS_CHARS.isdisjoint(spec):
         return False
 
     if "://" in spec or spec.startswith(("git+", "file:", "/", "\\", ".")):
         return False
 
-    return bool(_PIP_SPEC_PATTERN.match(spec))
+    return _PIP_SPEC_PATTERN.fullmatch(spec) is not None
 
 
+@lru_cache(maxsize=512)
 def _extract_base_name(spec: str) -> str:
     """Extract the base package name from a pip spec, stripping version/extras."""
-    name = re.split(r"[<>=!~\[]", spec.strip())[0]
-    return name
+    return _NAME_END_PATTERN.split(spec.strip(), maxsplit=1)[0]
 
 
 def is_pip_installed(package_name: str) -> bool:
@@ -69,12 +78,7 @@ def is_pip_installed(package_name: str) -> bool:
     Returns:
         True if the package is installed.
     """
-    base = _extract_base_name(package_name)
-    try:
-        importlib.metadata.version(base)
-        return True
-    except importlib.metadata.PackageNotFoundError:
-        return False
+    return _installed_version(_extract_base_name(package_name)) is not None
 
 
 def get_installed_version(package_name: str) -> Optional[str]:
@@ -86,7 +90,11 @@ def get_installed_version(package_name: str) -> Optional[str]:
     Returns:
         Version string or None if not installed.
     """
-    base = _extract_base_name(package_name)
+    return _installed_version(_extract_base_name(package_name))
+
+
+def _installed_version(base: str) -> Optional[str]:
+    """Look up an installed distribution's version."""
     try:
         return importlib.metadata.version(base)
     except importlib.metadata.PackageNotFoundError:
@@ -109,12 +117,16 @@ def installed_version_satisfies(spec: str) -> bool:
         return False
 
     # Extract version constraint from spec
-    constraint_match = re.search(r"([<>=!~]+.+)$", spec.strip())
+    constraint_match = _CONSTRAINT_PATTERN.search(spec.strip())
     if not constraint_match:
         return True
 
-    constraint = constraint_match.group(1)
+    return _version_satisfies(installed, constraint_match.group(1))
+
 
+@lru_cache(maxsize=256)
+def _version_satisfies(installed: str, constraint: str) -> bool:
+    """Check ``installed`` against ``constraint``, parsing each pair once."""
     try:
         from packaging.specifiers import SpecifierSet
         from packaging.version import Version
@@ -130,7 +142,54 @@ def installed_version_satisfies(spec: str) -> bool:
         return True
 
 
-def resolve_pip_package_for_command(command: str, args: list[str]) -> Optional[str]:
+class DistributionIndex:
+    """Installed-distribution lookups for one detection pass.
+
+    Distribution metadata is read on first use and kept for the life of the
+    instance, so resolving every MCP server command in a scan reads the
+    environment once. Create a new instance to see packages installed since.
+    """
+
+    def __init__(self) -> None:
+        self._packages: Optional[Mapping[str, list[str]]] = None
+        self._top_level: Optional[dict[str, str]] = None
+        self._scripts: Optional[dict[str, str]] = None
+
+    def distribution_for_module(self, module_name: str) -> Optional[str]:
+        """Find the distribution that provides a given top-level module.
+
+        Compatible with Python 3.10+ (packages_distributions() is 3.11+).
+        """
+        # Try packages_distributions() (3.11+)
+        try:
+            if self._packages is None:
+                self._packages = importlib.metadata.packages_distributions()  # type: ignore[attr-defined]
+            dists = self._packages.get(module_name)
+            if dists:
+                return dists[0]
+        except AttributeError:
+            pass
+
+        # Fallback for 3.10: search top_level.txt of every distribution
+        if self._top_level is None:
+            self._top_level = _top_level_module_index()
+        return self._top_level.get(module_name)
+
+    def distribution_for_script(self, script_name: str) -> Optional[str]:
+        """Find the distribution that provides a given console_script entry point."""
+        try:
+            if self._scripts is None:
+                self._scripts = _console_script_index()
+            return self._scripts.get(script_name)
+        except Exception:
+            return None
+
+
+def resolve_pip_package_for_command(
+    command: str,
+    args: list[str],
+    index: Optional[DistributionIndex] = None,
+) -> Optional[str]:
     """Resolve a command/args pair to a pip package name if possible.
 
     Patterns detected:
@@ -141,28 +200,31 @@ def resolve_pip_package_for_command(command: str, args: list[str]) -> Optional[s
     Args:
         command: The executable command.
         args: Command arguments.
+        index: Distribution lookups to reuse across calls; a fresh one is
+            used when omitted.
 
     Returns:
         Pip package name or None if unrecognized.
     """
     try:
-        return _resolve_pip_package_for_command_inner(command, args)
+        return _resolve_pip_package_for_command_inner(command, args, index or DistributionIndex())
     except Exception as e:
         logger.warning("Failed to resolve pip package for command %s: %s", command, e)
         return None
 
 
-def _resolve_pip_package_for_command_inner(command: str, args: list[str]) -> Optional[str]:
+def _resolve_pip_package_for_command_inner(command: str, args: list[str], index: DistributionIndex) -> Optional[str]:
     """Inner implementation of resolve_pip_package_for_command."""
     cmd_basename = os.path.basename(command)
 
     # Pattern 1: python -m module_name
-    if cmd_basename == "python" or cmd_basename == "python3" or re.match(r"python3\.\d+$", cmd_basename):
-        if "-m" in args:
-            m_idx = args.index("-m")
-            if m_idx + 1 < len(args):
-                module_name = args[m_idx + 1]
-                return _find_distribution_for_module(module_name)
+    if cmd_basename in _PYTHON_BASENAMES or _VERSIONED_PYTHON_PATTERN.match(cmd_basename):
+        try:
+            module_name = args[args.index("-m") + 1]
+        except (ValueError, IndexError):
+            pass
+        else:
+            return index.distribution_for_module(module_name)
 
     # Pattern 2: uvx package_name
     if cmd_basename == "uvx":
@@ -172,86 +234,67 @@ def _resolve_pip_package_for_command_inner(command: str, args: list[str]) -> Opt
                 return pkg_name
 
     # Pattern 3: command is a console_script entry point
-    dist = _find_distribution_for_script(cmd_basename)
+    dist = index.distribution_for_script(cmd_basename)
     if dist:
         return dist
 
     return None
 
 
-def _find_distribution_for_module(module_name: str) -> Optional[str]:
-    """Find the distribution that provides a given top-level module.
-
-    Compatible with Python 3.10+ (packages_distributions() is 3.11+).
-    """
-    # Try packages_distributions() (3.11+)
-    try:
-        pkg_dists = importlib.metadata.packages_distributions()  # type: ignore[attr-defined]
-        dists = pkg_dists.get(module_name)
-        if dists:
-            return dists[0]
-    except AttributeError:
-        pass
-
-    # Fallback for 3.10: iterate distributions
+def _top_level_module_index() -> dict[str, str]:
+    """Map each top-level module to the first distribution listing it in top_level.txt."""
+    index: dict[str, str] = {}
     for dist in importlib.metadata.distributions():
         top_level = dist.read_text("top_level.txt")
         if top_level:
-            modules = [m.strip() for m in top_level.strip().split("\n") if m.strip()]
-            if module_name in modules:
-                return dist.metadata["Name"]
-
-    return None
+            for module in top_level.split("\n"):
+                module = module.strip()
+                if module:
+                    index.setdefault(module, dist.metadata["Name"])
+    return index
 
 
-def _find_distribution_for_script(script_name: str) -> Optional[str]:
-    """Find the distribution that provides a given console_script entry point.
+def _console_script_index() -> dict[str, str]:
+    """Map each console_script name to its distribution.
 
     Compatible with Python 3.10+ (entry_points() API varies by version).
+    When several entry points share a name, the first one with a known
+    distribution wins.
     """
-    try:
-        eps = importlib.metadata.entry_points()
-        # Python 3.12+: eps.select()
-        if hasattr(eps, "select"):
-            console_scripts = eps.select(group="console_scripts")  # type: ignore[union-attr]
-        elif isinstance(eps, dict):
-            # Python 3.10-3.11: eps is a dict
-            console_scripts = eps.get("console_scripts", [])  # type: ignore[arg-type]
-        else:
-            console_scripts = []
-
-        for ep in console_scripts:
-            if ep.name == script_name:
-                # ep.dist may not exist on all versions
-                if hasattr(ep, "dist") and ep.dist is not None:
-                    return ep.dist.metadata["Name"]
-                continue
-    except Exception:
-        pass
+    eps = importlib.metadata.entry_points()
+    # Python 3.12+: eps.select()
+    if hasattr(eps, "select"):
+        console_scripts = eps.select(group="console_scripts")  # type: ignore[union-attr]
+    elif isinstance(eps, dict):
+        # Python 3.10-3.11: eps is a dict
+        console_scripts = eps.get("console_scripts", [])  # type: ignore[arg-type]
+    else:
+        console_scripts = []
 
-    return None
+    index: dict[str, str] = {}
+    for ep in console_scripts:
+        # ep.dist may not exist on all versions
+        dist = getattr(ep, "dist", None)
+        if dist is not None:
+            index.setdefault(ep.name, dist.metadata["Name"])
+    return index
 
 
 def find_pip_executable() -> Optional[str]:
     """Find a usable way to run pip.
 
     Prefers `sys.executable -m pip` (respects current venv),
-    falls back to `shutil.which("pip")`.
+    falls back to `shutil.which("pip")`. pip is looked up as an importable
+    module of the running interpreter rather than by spawning it.
 
     Returns:
         Python executable path (for `-m pip` usage) or standalone pip path,
         or None if pip is unavailable.
     """
     try:
-        result = subprocess.run(
-            [sys.executable, "-m", "pip", "--version"],
-            capture_output=True,
-            timeout=10,
-            check=False,
-        )
-        if result.returncode == 0:
+        if importlib.util.find_spec("pip") is not None:
             return sys.executable
-    except (OSError, subprocess.TimeoutExpired):
+    except (ImportError, ValueError):
         pass
 
     pip_path = shutil.which("pip")
@@ -273,8 +316,26 @@ def install_pip_package(spec: str, timeout: int = 120) -> tuple[bool, str]:
     Returns:
         Tuple of (success, message).
     """
-    if not validate_pip_spec(spec):
-        return (False, f"Invalid pip package spec: {spec}")
+    return install_pip_packages([spec], timeout=timeout)
+
+
+def install_pip_packages(specs: list[str], timeout: int = 300) -> tuple[bool, str]:
+    """Install several pip packages with a single pip invocation.
+
+    pip resolves the whole set at once, so this pays interpreter startup
+    and dependency resolution once instead of once per package. pip does
+    not install anything when any spec fails to resolve.
+
+    Args:
+        specs: Pip package specifiers; every one is validated first.
+        timeout: Maximum seconds to wait for the whole install.
+
+    Returns:
+        Tuple of (success, message).
+    """
+    for spec in specs:
+        if not validate_pip_spec(spec):
+            return (False, f"Invalid pip package spec: {spec}")
 
     pip_exe = find_pip_executable()
     if not pip_exe:
@@ -282,10 +343,11 @@ def install_pip_package(spec: str, timeout: int = 120) -> tuple[bool, str]:
 
     # Build command: either `python -m pip install` or `pip install`
     if pip_exe == sys.executable:
-        cmd = [sys.executable, "-m", "pip", "install", spec]
+        cmd = [sys.executable, "-m", "pip", "install", *specs]
     else:
-        cmd = [pip_exe, "install", spec]
+        cmd = [pip_exe, "install", *specs]
 
+    label = ", ".join(specs)
     try:
         result = subprocess.run(
             cmd,
@@ -296,19 +358,19 @@ def install_pip_package(spec: str, timeout: int = 120) -> tuple[bool, str]:
         )
 
         if result.returncode == 0:
-            return (True, f"Successfully installed {spec}")
+            return (True, f"Successfully installed {label}")
 
         stderr = result.stderr.lower()
         if "no matching distribution" in stderr:
-            return (False, f"Package not found: {spec}")
+            return (False, f"Package not found: {label}")
         if "could not find a version" in stderr:
-            return (False, f"No compatible version found for {spec}")
+            return (False, f"No compatible version found for {label}")
         if "permission denied" in stderr or "permissionerror" in stderr:
-            return (False, f"Permission denied installing {spec}. Try using a virtual environment.")
+            return (False, f"Permission denied installing {label}. Try using a virtual environment.")
 
-        return (False, f"pip install failed for {spec} (exit code {result.returncode})")
+        return (False, f"pip install failed for {label} (exit code {result.returncode})")
 
     except subprocess.TimeoutExpired:
-        return (False, f"pip install timed out after {timeout}s for {spec}")
+        return (False, f"pip install timed out after {timeout}s for {label}")
     except OSError as e:
         return (False, f"Failed to run pip: {e}")
@@ -6,7 +6,7 @@ from typing import Optional
 from devsync.core.pip_utils import validate_pip_spec
 
 
-@dataclass
+@dataclass(slots=True)
 class CredentialSpec:
     """Specification for a credential required by an MCP server.
 
@@ -48,7 +48,7 @@ class CredentialSpec:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class PracticeDeclaration:
     """An abstract coding practice extracted from project configs.
 
@@ -114,7 +114,7 @@ class PracticeDeclaration:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class MCPDeclaration:
     """Declaration for an MCP server configuration.
 
@@ -2,11 +2,78 @@
 
 import math
 import re
+import string
+from collections import Counter
 from dataclasses import dataclass, field
-from typing import Any, Optional
+from functools import lru_cache
+from typing import Any, Iterator, Optional
 
 from devsync.core.models import SecretConfidence
 
+_VERSION_RE = re.compile(r"^v?\d+(\.\d+){0,3}(-[\w.]+)?(\+[\w.]+)?$")
+# API key, JWT, and base64 shapes in one anchored pass; the character sets make
+# the alternatives mutually exclusive except api key vs base64, where the api
+# key alternative is tried first.
+_TOKEN_RE = re.compile(
+    r"^(?:"
+    r"(?P<apikey>[A-Za-z0-9_-]{20,})"
+    r"|(?P<jwt>eyJ[A-Za-z0-9_-]+\.eyJ[A-Za-z0-9_-]+\.[A-Za-z0-9_-]+)"
+    r"|(?P<base64>[A-Za-z0-9+/=]{16,})"
+    r")$"
+)
+_BOOLEAN_VALUES = frozenset({"true", "false", "yes", "no", "1", "0", "on", "off"})
+_BOOLEAN_MAX_LENGTH = max(len(v) for v in _BOOLEAN_VALUES)
+_DIGIT_RE = re.compile(r"\d")
+_NON_FINITE_WORDS = frozenset({"nan", "inf", "infinity"})
+_URL_PREFIXES = ("http://", "https://")
+_URL_CRED_RE = re.compile(r"^https?://[^/]+:[^@]+@", re.IGNORECASE)
+
+# Deletes every character that can appear in an API key, JWT, or base64 token.
+# Anything left over means none of the token patterns can match.
+_TOKEN_CHARS_DELETE = str.maketrans("", "", string.ascii_letters + string.digits + "_-+/=.")
+
+
+def _shannon_entropy(value: str) -> float:
+    """Calculate Shannon entropy of a string.
+
+    Args:
+        value: String to analyze
+
+    Returns:
+        Entropy in bits per character
+    """
+    if not value:
+        return 0.0
+
+    # H = log2(N) - sum(c * log2(c)) / N, with character counts taken in C
+    length = len(value)
+    weighted = 0.0
+    for count in Counter(value).values():
+        weighted += count * math.log2(count)
+
+    return math.log2(length) - weighted / length
+
+
+@lru_cache(maxsize=1024)
+def _template_placeholder(key: str) -> str:
+    """Build the ${KEY} placeholder for a key name, memoized per key.
+
+    Args:
+        key: The key name (e.g., "API_KEY", "github_token")
+
+    Returns:
+        Template placeholder (e.g., "${API_KEY}")
+    """
+    normalized_key = key.upper().replace("-", "_")
+    if not normalized_key.startswith("$"):
+        return f"${{{normalized_key}}}"
+    return normalized_key
+
+
+# (confidence, reason format string, reason arguments, templated_value) produced by
+# the individual checks; only detect() formats the reason, classify() never needs it
+_Verdict = tuple[SecretConfidence, str, tuple[Any, ...], Optional[str]]
+
 
 @dataclass
 class SecretDetectionResult:
@@ -72,6 +139,29 @@ class SecretDetector:
 
     ambiguous_keywords: list[str] = field(default_factory=lambda: ["URL", "ID", "ENDPOINT", "URI"])
 
+    def __post_init__(self) -> None:
+        """Precompute the keyword lookups used by _keyword_match.
+
+        The combined pattern uses a lookahead so every start position reports
+        its longest keyword; keywords contained in that match are added back
+        via a containment table, giving the exact set of keywords in a key.
+        """
+        self._safe_keyword_set = frozenset(self.safe_keywords)
+        self._secret_keyword_set = frozenset(self.secret_keywords)
+        secret_keywords = [kw for kw in self.secret_keywords if kw]
+        self._secret_keyword_re: Optional[re.Pattern[str]] = None
+        if secret_keywords:
+            self._secret_keyword_re = re.compile("|".join(re.escape(kw) for kw in secret_keywords))
+
+        keywords = set(self.secret_keywords) | set(self.safe_keywords) | set(self.ambiguous_keywords)
+        keywords.discard("")
+        self._keyword_re: Optional[re.Pattern[str]] = None
+        self._keyword_closure: dict[str, frozenset[str]] = {}
+        if keywords:
+            alternation = "|".join(re.escape(kw) for kw in sorted(keywords, key=len, reverse=True))
+            self._keyword_re = re.compile(f"(?=({alternation}))")
+            self._keyword_closure = {kw: frozenset(other for other in keywords if other in kw) for kw in keywords}
+
     def detect(self, value: str, key_name: str = "") -> SecretDetectionResult:
         """Analyze a value to determine if it's likely a secret.
 
@@ -82,19 +172,62 @@ class SecretDetector:
         Returns:
             SecretDetectionResult with confidence level and explanation
         """
-        if not value or not value.strip():
-            return SecretDetectionResult(
-                confidence=SecretConfidence.SAFE,
-                reason="Empty or whitespace-only value",
-                original_value=value,
-            )
+        confidence, reason, reason_args, templated_value = self._evaluate(value, key_name.upper() if key_name else "")
+        return SecretDetectionResult(
+            confidence=confidence,
+            reason=reason.format(*reason_args),
+            original_value=value,
+            templated_value=templated_value,
+        )
 
-        key_upper = key_name.upper() if key_name else ""
+    def classify(
+        self, value: str, key_name: str = "", *, key_upper: Optional[str] = None
+    ) -> tuple[SecretConfidence, Optional[str]]:
+        """Classify a value without building a full detection result.
+
+        Gives the same confidence and templated value as detect(), but skips
+        formatting the human-readable reason.
+
+        Args:
+            value: The value to analyze
+            key_name: Optional environment variable or key name (e.g., "API_KEY")
+            key_upper: key_name already uppercased; when given, key_name is ignored
+
+        Returns:
+            Tuple of (confidence, suggested template replacement or None)
+        """
+        if key_upper is None:
+            key_upper = key_name.upper() if key_name else ""
+        confidence, _, _, templated_value = self._evaluate(value, key_upper)
+        return confidence, templated_value
+
+    def _evaluate(self, value: str, key_upper: str) -> _Verdict:
+        """Run the keyword, pattern, and entropy checks in order.
+
+        Args:
+            value: The value to analyze
+            key_upper: Uppercase key name
+
+        Returns:
+            Verdict from the first check that applies
+        """
+        if not value or not value.strip():
+            return (SecretConfidence.SAFE, "Empty or whitespace-only value", (), None)
 
         keyword_result = self._keyword_match(key_upper, value)
         if keyword_result:
             return keyword_result
 
+        # Short values are safe regardless of shape, so skip every pattern probe
+        value_length = len(value)
+        if value_length < self.min_secret_length:
+            return (
+                SecretConfidence.SAFE,
+                "Value too short ({} chars < {})",
+                (value_length, self.min_secret_length),
+                None,
+            )
+
         pattern_result = self._pattern_match(value, key_upper)
         if pattern_result:
             return pattern_result
@@ -103,11 +236,7 @@ class SecretDetector:
         if entropy_result:
             return entropy_result
 
-        return SecretDetectionResult(
-            confidence=SecretConfidence.SAFE,
-            reason="No secret indicators detected",
-            original_value=value,
-        )
+        return (SecretConfidence.SAFE, "No secret indicators detected", (), None)
 
     def template_value(self, key: str) -> str:
         """Convert a key name to a template placeholder.
@@ -118,12 +247,9 @@ class SecretDetector:
         Returns:
             Template placeholder (e.g., "${API_KEY}")
         """
-        normalized_key = key.upper().replace("-", "_")
-        if not normalized_key.startswith("$"):
-            return f"${{{normalized_key}}}"
-        return normalized_key
+        return _template_placeholder(key)
 
-    def _keyword_match(self, key_upper: str, value: str) -> Optional[SecretDetectionResult]:
+    def _keyword_match(self, key_upper: str, value: str) -> Optional[_Verdict]:
         """Check for secret-related keywords in the key name.
 
         Args:
@@ -131,127 +257,174 @@ class SecretDetector:
             value: The value being analyzed
 
         Returns:
-            SecretDetectionResult if keyword matched, None otherwise
+            Verdict if keyword matched, None otherwise
         """
         if not key_upper:
             return None
 
+        found = self._find_keywords(key_upper)
+        if not found:
+            return None
+
+        parts = key_upper.split("_")
         for safe_kw in self.safe_keywords:
-            if safe_kw in key_upper:
-                parts = key_upper.split("_")
-                if safe_kw in parts:
-                    is_only_safe = True
-                    for part in parts:
-                        if part and part not in self.safe_keywords and any(sk in part for sk in self.secret_keywords):
-                            is_only_safe = False
-                            break
-                    if is_only_safe:
-                        return SecretDetectionResult(
-                            confidence=SecretConfidence.SAFE,
-                            reason=f"Key contains safe keyword '{safe_kw}'",
-                            original_value=value,
-                        )
+            if safe_kw in found and safe_kw in parts:
+                if self._is_only_safe(parts, found):
+                    return (
+                        SecretConfidence.SAFE,
+                        "Key contains safe keyword '{}'",
+                        (safe_kw,),
+                        None,
+                    )
+                break
 
         for secret_kw in self.secret_keywords:
-            if secret_kw in key_upper:
-                return SecretDetectionResult(
-                    confidence=SecretConfidence.HIGH,
-                    reason=f"Key contains secret keyword '{secret_kw}'",
-                    original_value=value,
-                    templated_value=self.template_value(key_upper),
+            if secret_kw in found:
+                return (
+                    SecretConfidence.HIGH,
+                    "Key contains secret keyword '{}'",
+                    (secret_kw,),
+                    self.template_value(key_upper),
                 )
 
+        # The checks below depend only on the value, so the first ambiguous keyword decides
         for ambig_kw in self.ambiguous_keywords:
-            if ambig_kw in key_upper:
+            if ambig_kw in found:
                 if self._contains_credentials_in_url(value):
-                    return SecretDetectionResult(
-                        confidence=SecretConfidence.HIGH,
-                        reason=f"Key contains '{ambig_kw}' with embedded credentials",
-                        original_value=value,
-                        templated_value=self.template_value(key_upper),
+                    return (
+                        SecretConfidence.HIGH,
+                        "Key contains '{}' with embedded credentials",
+                        (ambig_kw,),
+                        self.template_value(key_upper),
                     )
                 entropy = self._calculate_entropy(value)
                 if entropy > self.high_entropy_threshold:
-                    return SecretDetectionResult(
-                        confidence=SecretConfidence.MEDIUM,
-                        reason=f"Key contains '{ambig_kw}' with high entropy value",
-                        original_value=value,
-                        templated_value=self.template_value(key_upper),
+                    return (
+                        SecretConfidence.MEDIUM,
+                        "Key contains '{}' with high entropy value",
+                        (ambig_kw,),
+                        self.template_value(key_upper),
                     )
+                break
 
         return None
 
-    def _pattern_match(self, value: str, key_upper: str) -> Optional[SecretDetectionResult]:
-        """Check for known secret patterns in the value.
+    def _is_only_safe(self, parts: list[str], found: set[str]) -> bool:
+        """Check that no non-safe key part contains a secret keyword.
+
+        Args:
+            parts: Key name split on underscores
+            found: Keywords found anywhere in the key
+
+        Returns:
+            True if the key has no secret-bearing part
+        """
+        if found.isdisjoint(self._secret_keyword_set) or self._secret_keyword_re is None:
+            return True
+        safe_set = self._safe_keyword_set
+        search = self._secret_keyword_re.search
+        return not any(part and part not in safe_set and search(part) for part in parts)
+
+    def _find_keywords(self, key_upper: str) -> set[str]:
+        """Return every configured keyword that occurs in the key name.
+
+        Args:
+            key_upper: Uppercase key name
+
+        Returns:
+            Set of keywords found as substrings of the key
+        """
+        if self._keyword_re is None:
+            return set()
+        found: set[str] = set()
+        for match in self._keyword_re.findall(key_upper):
+            found |= self._keyword_closure[match]
+        return found
+
+    def _pattern_match(self, value: str, key_upper: str) -> Optional[_Verdict]:
+        """Check for known secret patterns in a value of at least min_secret_length.
 
         Args:
             value: The value to analyze
             key_upper: Uppercase key name for templating
 
         Returns:
-            SecretDetectionResult if pattern matched, None otherwise
+            Verdict if pattern matched, None otherwise
         """
         if self._is_boolean_value(value):
-            return SecretDetectionResult(
-                confidence=SecretConfidence.SAFE,
-                reason="Boolean value",
-                original_value=value,
+            return (
+                SecretConfidence.SAFE,
+                "Boolean value",
+                (),
+                None,
             )
 
         if self._is_numeric_value(value):
-            return SecretDetectionResult(
-                confidence=SecretConfidence.SAFE,
-                reason="Numeric value",
-                original_value=value,
+            return (
+                SecretConfidence.SAFE,
+                "Numeric value",
+                (),
+                None,
             )
 
         if self._is_version_string(value):
-            return SecretDetectionResult(
-                confidence=SecretConfidence.SAFE,
-                reason="Version string",
-                original_value=value,
+            return (
+                SecretConfidence.SAFE,
+                "Version string",
+                (),
+                None,
             )
 
-        if len(value) < self.min_secret_length:
-            return SecretDetectionResult(
-                confidence=SecretConfidence.SAFE,
-                reason=f"Value too short ({len(value)} chars < {self.min_secret_length})",
-                original_value=value,
-            )
+        # Token-shaped values cannot contain "://", so the URL probe only runs otherwise
+        if not value.translate(_TOKEN_CHARS_DELETE):
+            return self._token_match(value, key_upper)
+
+        return self._analyze_url(value)
+
+    def _token_match(self, value: str, key_upper: str) -> Optional[_Verdict]:
+        """Check a token-shaped value against API key, JWT, and base64 patterns.
+
+        Args:
+            value: Value made up only of token characters
+            key_upper: Uppercase key name for templating
+
+        Returns:
+            Verdict if a token pattern matched, None otherwise
+        """
+        match = _TOKEN_RE.match(value)
+        if match is None:
+            return None
 
-        if self._matches_api_key_pattern(value):
-            return SecretDetectionResult(
-                confidence=SecretConfidence.HIGH,
-                reason="Matches API key pattern (20+ alphanumeric characters)",
-                original_value=value,
-                templated_value=self.template_value(key_upper) if key_upper else None,
+        kind = match.lastgroup
+        if kind == "apikey":
+            return (
+                SecretConfidence.HIGH,
+                "Matches API key pattern (20+ alphanumeric characters)",
+                (),
+                self.template_value(key_upper) if key_upper else None,
             )
 
-        if self._matches_jwt_pattern(value):
-            return SecretDetectionResult(
-                confidence=SecretConfidence.HIGH,
-                reason="Matches JWT token pattern",
-                original_value=value,
-                templated_value=self.template_value(key_upper) if key_upper else None,
+        if kind == "jwt":
+            return (
+                SecretConfidence.HIGH,
+                "Matches JWT token pattern",
+                (),
+                self.template_value(key_upper) if key_upper else None,
             )
 
-        if self._matches_base64_secret_pattern(value):
+        if self._is_base64_secret_shape(value):
             entropy = self._calculate_entropy(value)
             if entropy > self.high_entropy_threshold:
-                return SecretDetectionResult(
-                    confidence=SecretConfidence.HIGH,
-                    reason="Matches base64 encoded secret pattern with high entropy",
-                    original_value=value,
-                    templated_value=self.template_value(key_upper) if key_upper else None,
+                return (
+                    SecretConfidence.HIGH,
+                    "Matches base64 encoded secret pattern with high entropy",
+                    (),
+                    self.template_value(key_upper) if key_upper else None,
                 )
 
-        url_analysis = self._analyze_url(value)
-        if url_analysis:
-            return url_analysis
-
         return None
 
-    def _entropy_analysis(self, value: str, key_upper: str) -> Optional[SecretDetectionResult]:
+    def _entropy_analysis(self, value: str, key_upper: str) -> Optional[_Verdict]:
         """Analyze value entropy to detect potential secrets.
 
         Args:
@@ -259,7 +432,7 @@ class SecretDetector:
             key_upper: Uppercase key name for templating
 
         Returns:
-            SecretDetectionResult if high entropy detected, None otherwise
+            Verdict if high entropy detected, None otherwise
         """
         if len(value) < self.min_secret_length:
             return None
@@ -267,11 +440,11 @@ class SecretDetector:
         entropy = self._calculate_entropy(value)
 
         if entropy > self.high_entropy_threshold:
-            return SecretDetectionResult(
-                confidence=SecretConfidence.MEDIUM,
-                reason=f"High entropy value ({entropy:.2f} bits/char)",
-                original_value=value,
-                templated_value=self.template_value(key_upper) if key_upper else None,
+            return (
+                SecretConfidence.MEDIUM,
+                "High entropy value ({:.2f} bits/char)",
+                (entropy,),
+                self.template_value(key_upper) if key_upper else None,
             )
 
         return None
@@ -285,28 +458,24 @@ class SecretDetector:
         Returns:
             Entropy in bits per character
         """
-        if not value:
-            return 0.0
-
-        char_counts: dict[str, int] = {}
-        for char in value:
-            char_counts[char] = char_counts.get(char, 0) + 1
-
-        entropy = 0.0
-        length = len(value)
-        for count in char_counts.values():
-            if count > 0:
-                probability = count / length
-                entropy -= probability * math.log2(probability)
-
-        return entropy
+        return _shannon_entropy(value)
 
     def _is_boolean_value(self, value: str) -> bool:
         """Check if value is a boolean."""
-        return value.lower() in ("true", "false", "yes", "no", "1", "0", "on", "off")
+        if len(value) > _BOOLEAN_MAX_LENGTH:
+            return False
+        return value.lower() in _BOOLEAN_VALUES
 
     def _is_numeric_value(self, value: str) -> bool:
         """Check if value is purely numeric."""
+        if value.isdecimal():
+            return True
+        # float() accepts nan/inf spellings without digits; anything else needs one
+        if _DIGIT_RE.search(value) is None:
+            word = value.strip().lower()
+            if word[:1] in ("+", "-"):
+                word = word[1:]
+            return word in _NON_FINITE_WORDS
         try:
             float(value)
             return True
@@ -315,63 +484,47 @@ class SecretDetector:
 
     def _is_version_string(self, value: str) -> bool:
         """Check if value looks like a version string."""
-        version_pattern = r"^v?\d+(\.\d+){0,3}(-[\w.]+)?(\+[\w.]+)?$"
-        return bool(re.match(version_pattern, value))
+        return bool(_VERSION_RE.match(value))
 
-    def _matches_api_key_pattern(self, value: str) -> bool:
-        """Check if value matches common API key patterns."""
-        if len(value) < 20:
-            return False
-        api_key_pattern = r"^[A-Za-z0-9_-]{20,}$"
-        return bool(re.match(api_key_pattern, value))
-
-    def _matches_jwt_pattern(self, value: str) -> bool:
-        """Check if value matches JWT token pattern."""
-        jwt_pattern = r"^eyJ[A-Za-z0-9_-]+\.eyJ[A-Za-z0-9_-]+\.[A-Za-z0-9_-]+$"
-        return bool(re.match(jwt_pattern, value))
+    def _is_base64_secret_shape(self, value: str) -> bool:
+        """Check if a value already matching the base64 alphabet looks like a secret."""
+        if value.endswith("="):
+            return True
+        # Only "+", "/" and "=" in the base64 alphabet are not alphanumeric
+        symbols = value.count("+") + value.count("/") + value.count("=")
+        alphanumeric_ratio = (len(value) - symbols) / len(value)
+        return alphanumeric_ratio > 0.9
 
-    def _matches_base64_secret_pattern(self, value: str) -> bool:
-        """Check if value looks like a base64-encoded secret."""
-        if len(value) < 16:
-            return False
-        base64_pattern = r"^[A-Za-z0-9+/=]{16,}$"
-        if re.match(base64_pattern, value):
-            if value.endswith("==") or value.endswith("="):
-                return True
-            alphanumeric_ratio = sum(c.isalnum() for c in value) / len(value)
-            return alphanumeric_ratio > 0.9
-        return False
-
-    def _analyze_url(self, value: str) -> Optional[SecretDetectionResult]:
+    def _analyze_url(self, value: str) -> Optional[_Verdict]:
         """Analyze URL values for embedded credentials.
 
         Args:
             value: The value to analyze
 
         Returns:
-            SecretDetectionResult if URL analysis applies
+            Verdict if URL analysis applies
         """
-        url_pattern = r"^https?://"
-        if not re.match(url_pattern, value, re.IGNORECASE):
+        if not value[:8].lower().startswith(_URL_PREFIXES):
             return None
 
         if self._contains_credentials_in_url(value):
-            return SecretDetectionResult(
-                confidence=SecretConfidence.HIGH,
-                reason="URL contains embedded credentials",
-                original_value=value,
+            return (
+                SecretConfidence.HIGH,
+                "URL contains embedded credentials",
+                (),
+                None,
             )
 
-        return SecretDetectionResult(
-            confidence=SecretConfidence.SAFE,
-            reason="URL without embedded credentials",
-            original_value=value,
+        return (
+            SecretConfidence.SAFE,
+            "URL without embedded credentials",
+            (),
+            None,
         )
 
     def _contains_credentials_in_url(self, value: str) -> bool:
         """Check if URL contains embedded credentials (user:pass@)."""
-        cred_pattern = r"https?://[^/]+:[^@]+@"
-        return bool(re.match(cred_pattern, value, re.IGNORECASE))
+        return bool(_URL_CRED_RE.match(value))
 
 
 def template_secrets_in_config(
@@ -379,6 +532,8 @@ def template_secrets_in_config(
 ) -> tuple[dict[str, Any], list[str]]:
     """Process a configuration dict and template detected secrets.
 
+    Each string value is checked with ``detector.classify``.
+
     Args:
         config: Configuration dictionary (e.g., MCP server config)
         detector: SecretDetector instance (creates default if None)
@@ -390,7 +545,7 @@ def template_secrets_in_config(
         detector = SecretDetector()
 
     templated_keys: list[str] = []
-    result = _template_dict_recursive(config, detector, templated_keys, "")
+    result = _template_dict_recursive(config, detector, templated_keys)
 
     # We know the result is a dict since config is a dict
     assert isinstance(result, dict)
@@ -401,38 +556,77 @@ def _template_dict_recursive(
     obj: Any,
     detector: SecretDetector,
     templated_keys: list[str],
-    current_path: str,
 ) -> Any:
-    """Recursively process nested structures for secret templating.
+    """Walk nested structures and template secrets found in dict string values.
+
+    Uses an explicit stack of child iterators instead of recursion, visiting keys
+    in the same depth-first order without a Python frame per container. Lists
+    that hold no containers are copied in a single step, each distinct key is
+    uppercased once per walk, and each distinct (key, value) pair is classified
+    once per walk, since MCP configs repeat values across servers.
 
     Args:
         obj: Object to process
         detector: SecretDetector instance
         templated_keys: List to append templated key names
-        current_path: Current key path for context
 
     Returns:
         Processed object with secrets templated
     """
-    if isinstance(obj, dict):
-        result: dict[str, Any] = {}
-        for key, value in obj.items():
-            path = f"{current_path}.{key}" if current_path else key
-            if isinstance(value, str):
-                detection = detector.detect(value, key)
-                if detection.confidence in (SecretConfidence.HIGH, SecretConfidence.MEDIUM):
-                    if detection.templated_value:
-                        result[key] = detection.templated_value
-                        templated_keys.append(key)
-                    else:
-                        result[key] = detector.template_value(key)
-                        templated_keys.append(key)
+    if not isinstance(obj, (dict, list)):
+        return obj
+
+    classify = detector.classify
+    upper_keys: dict[str, str] = {}
+    verdicts: dict[tuple[str, str], tuple[SecretConfidence, Optional[str]]] = {}
+    template_value = detector.template_value
+    record_key = templated_keys.append
+
+    root: Any = {} if isinstance(obj, dict) else []
+    stack: list[tuple[Iterator[tuple[Any, Any]], Any]] = [(_iter_children(obj), root)]
+    while stack:
+        children, target = stack[-1]
+        is_dict = isinstance(target, dict)
+        for key, value in children:
+            child: Any
+            descend = False
+            if is_dict and isinstance(value, str):
+                key_upper = upper_keys.get(key)
+                if key_upper is None:
+                    key_upper = upper_keys[key] = key.upper()
+                verdict = verdicts.get((key_upper, value))
+                if verdict is None:
+                    verdict = verdicts[(key_upper, value)] = classify(value, key_upper=key_upper)
+                confidence, templated_value = verdict
+                if confidence.is_secret:
+                    child = templated_value or template_value(key)
+                    record_key(key)
+                else:
+                    child = value
+            elif isinstance(value, dict):
+                child, descend = {}, True
+            elif isinstance(value, list):
+                if any(isinstance(item, (dict, list)) for item in value):
+                    child, descend = [], True
                 else:
-                    result[key] = value
+                    child = list(value)
             else:
-                result[key] = _template_dict_recursive(value, detector, templated_keys, path)
-        return result
-    elif isinstance(obj, list):
-        return [_template_dict_recursive(item, detector, templated_keys, current_path) for item in obj]
-    else:
-        return obj
+                child = value
+
+            if is_dict:
+                target[key] = child
+            else:
+                target.append(child)
+
+            if descend:
+                stack.append((_iter_children(value), child))
+                break
+        else:
+            stack.pop()
+
+    return root
+
+
+def _iter_children(obj: Any) -> Iterator[tuple[Any, Any]]:
+    """Iterate (key, value) pairs of a dict or (index, item) pairs of a list."""
+    return iter(obj.items()) if isinstance(obj, dict) else enumerate(obj)
@@ -4,9 +4,11 @@ from typing import Optional
 
 import httpx
 
+from devsync.llm.http_client import PooledHTTPClient
 from devsync.llm.provider import LLMProvider, LLMProviderError, LLMResponse
 
 _API_URL = "https://api.anthropic.com/v1/messages"
+_MODELS_URL = "https://api.anthropic.com/v1/models"
 _API_VERSION = "2023-06-01"
 _DEFAULT_MODEL = "claude-sonnet-4-20250514"
 
@@ -20,6 +22,7 @@ class AnthropicProvider(LLMProvider):
     def __init__(self, api_key: str, model: Optional[str] = None):
         self._api_key = api_key
         self._model = model or _DEFAULT_MODEL
+        self._http = PooledHTTPClient()
 
     @property
     def name(self) -> str:
@@ -55,8 +58,7 @@ class AnthropicProvider(LLMProvider):
             body["system"] = system
 
         try:
-            with httpx.Client(timeout=120.0) as client:
-                response = client.post(_API_URL, headers=headers, json=body)
+            response = self._http.get().post(_API_URL, headers=headers, json=body)
         except httpx.HTTPError as e:
             raise LLMProviderError(f"HTTP error calling Anthropic API: {e}") from e
 
@@ -89,9 +91,14 @@ class AnthropicProvider(LLMProvider):
             raw_response=raw,
         )
 
+    def close(self) -> None:
+        self._http.close()
+
     def validate_api_key(self) -> bool:
+        # Listing models is authenticated but generates nothing, so no tokens are billed
+        headers = {"x-api-key": self._api_key, "anthropic-version": _API_VERSION}
         try:
-            self.complete("Say 'ok'.", max_tokens=10)
-            return True
-        except LLMProviderError:
+            response = self._http.get().get(_MODELS_URL, headers=headers, params={"limit": 1})
+        except httpx.HTTPError:
             return False
+        return response.status_code == 200
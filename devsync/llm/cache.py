@@ -0,0 +1,174 @@
+"""Exact-match on-disk cache for LLM responses.
+
+Opt-in via DEVSYNC_LLM_CACHE=1. Only deterministic requests
+(temperature 0) are cached; the key hashes everything that shapes the
+response, so any change to the provider, prompt, system message, model or
+token limit is a miss. Responses are stored only after the caller has
+parsed and validated them, and expire after ``DEFAULT_MAX_AGE`` seconds.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from devsync.llm.provider import LLMProvider, LLMResponse
+
+LLM_CACHE_ENV_VAR = "DEVSYNC_LLM_CACHE"
+
+DEFAULT_MAX_AGE = 7 * 24 * 60 * 60
+
+_DEFAULT_CACHE_PATH = Path.home() / ".devsync" / "llm-cache.sqlite"
+
+# Bumped whenever the table layout changes; older tables are dropped.
+_SCHEMA_VERSION = 1
+
+# Responses awaiting confirmation; callers confirm right after parsing, so
+# only replies that failed validation ever age out of this window.
+_MAX_PENDING = 64
+
+
+class ResponseCache:
+    """SQLite-backed store of LLM responses keyed by request hash.
+
+    Entries older than ``max_age`` seconds are treated as misses and pruned
+    when the database is opened. Safe to share between threads; all access
+    goes through one lock.
+    """
+
+    def __init__(self, path: Optional[Path] = None, max_age: float = DEFAULT_MAX_AGE):
+        self._path = path or _DEFAULT_CACHE_PATH
+        self._max_age = max_age
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @staticmethod
+    def make_key(provider: str, model: str, system: str, prompt: str, max_tokens: int) -> str:
+        """Hash the request fields that determine the response."""
+        payload = "\0".join((provider, model, system, prompt, str(max_tokens)))
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[LLMResponse]:
+        """Return the cached response for ``key``, or None on a miss or expired entry."""
+        with self._lock:
+            row = (
+                self._connect()
+                .execute(
+                    "SELECT content, model, usage FROM responses WHERE key = ? AND created_at >= ?",
+                    (key, time.time() - self._max_age),
+                )
+                .fetchone()
+            )
+        if row is None:
+            return None
+        content, model, usage = row
+        return LLMResponse(content=content, model=model, usage=json.loads(usage))
+
+    def put(self, key: str, response: LLMResponse) -> None:
+        """Store ``response`` under ``key``, replacing any previous entry."""
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, content, model, usage, created_at) VALUES (?, ?, ?, ?, ?)",
+                (key, response.content, response.model, json.dumps(response.usage), time.time()),
+            )
+            conn.commit()
+
+    def clear(self) -> None:
+        """Delete every stored response."""
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM responses")
+            conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self._path), check_same_thread=False)
+            if conn.execute("PRAGMA user_version").fetchone()[0] != _SCHEMA_VERSION:
+                conn.execute("DROP TABLE IF EXISTS responses")
+                conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, content TEXT NOT NULL, "
+                "model TEXT NOT NULL, usage TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+            conn.execute("DELETE FROM responses WHERE created_at < ?", (time.time() - self._max_age,))
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+
+class CachedLLMProvider(LLMProvider):
+    """Wraps a provider so repeated deterministic requests are served from a ResponseCache.
+
+    Fresh responses are held back until the caller passes them to
+    ``confirm_response``, so only replies that parsed and validated are
+    written to the cache. At most ``_MAX_PENDING`` unconfirmed responses are
+    kept; the oldest is dropped (and simply not cached) beyond that.
+    """
+
+    def __init__(self, provider: LLMProvider, cache: Optional[ResponseCache] = None):
+        self._provider = provider
+        self._cache = cache or ResponseCache()
+        # id(response) -> (response, key) for responses awaiting confirmation
+        self._pending: dict[int, tuple[LLMResponse, str]] = {}
+        self._pending_lock = threading.Lock()
+
+    @property
+    def name(self) -> str:
+        return self._provider.name
+
+    @property
+    def default_model(self) -> str:
+        return self._provider.default_model
+
+    def complete(
+        self,
+        prompt: str,
+        *,
+        system: str = "",
+        model: Optional[str] = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.0,
+    ) -> LLMResponse:
+        if temperature > 0:
+            return self._provider.complete(
+                prompt, system=system, model=model, max_tokens=max_tokens, temperature=temperature
+            )
+
+        key = ResponseCache.make_key(self.name, model or self.default_model, system, prompt, max_tokens)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        response = self._provider.complete(prompt, system=system, model=model, max_tokens=max_tokens, temperature=0.0)
+        with self._pending_lock:
+            self._pending[id(response)] = (response, key)
+            if len(self._pending) > _MAX_PENDING:
+                del self._pending[next(iter(self._pending))]
+        return response
+
+    def confirm_response(self, response: LLMResponse) -> None:
+        with self._pending_lock:
+            entry = self._pending.pop(id(response), None)
+        if entry is not None and entry[0] is response:
+            self._cache.put(entry[1], response)
+
+    def validate_api_key(self) -> bool:
+        return self._provider.validate_api_key()
+
+    def close(self) -> None:
+        with self._pending_lock:
+            self._pending.clear()
+        self._provider.close()
+        self._cache.close()
@@ -10,11 +10,15 @@ from typing import Optional
 
 import yaml
 
+# Prefer the libyaml C bindings when PyYAML was built with them
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 _CONFIG_DIR = Path.home() / ".devsync"
 _CONFIG_FILE = _CONFIG_DIR / "config.yaml"
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMConfig:
     """LLM configuration (no secrets stored).
 
@@ -61,7 +65,7 @@ def load_config(config_path: Optional[Path] = None) -> LLMConfig:
         return LLMConfig()
 
     with open(path) as f:
-        data = yaml.safe_load(f) or {}
+        data = yaml.load(f, Loader=_YAML_LOADER) or {}
 
     llm_data = data.get("llm", {})
     return LLMConfig.from_dict(llm_data)
@@ -83,9 +87,9 @@ def save_config(config: LLMConfig, config_path: Optional[Path] = None) -> None:
     existing: dict = {}
     if path.exists():
         with open(path) as f:
-            existing = yaml.safe_load(f) or {}
+            existing = yaml.load(f, Loader=_YAML_LOADER) or {}
 
     existing["llm"] = config.to_dict()
 
     with open(path, "w") as f:
-        yaml.dump(existing, f, default_flow_style=False, sort_keys=False)
+        yaml.dump(existing, f, Dumper=_YAML_DUMPER, default_flow_style=False, sort_keys=False)
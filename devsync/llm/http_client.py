@@ -0,0 +1,41 @@
+"""Pooled HTTP client shared by the LLM provider implementations.
+
+Kept out of devsync.llm.provider so that resolving a provider does not
+import httpx until a concrete provider module is loaded.
+"""
+
+import threading
+from typing import Optional
+
+import httpx
+
+_HTTP_TIMEOUT = 120.0
+
+
+class PooledHTTPClient:
+    """An httpx.Client created on first use and reused for every request.
+
+    Keeping one client per provider lets consecutive API calls (including
+    concurrent ones from worker threads) reuse open TCP/TLS connections
+    instead of handshaking on every request.
+    """
+
+    def __init__(self, timeout: float = _HTTP_TIMEOUT):
+        self._timeout = timeout
+        self._client: Optional[httpx.Client] = None
+        self._lock = threading.Lock()
+
+    def get(self) -> httpx.Client:
+        """Return the shared client, creating it if needed."""
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    self._client = httpx.Client(timeout=self._timeout)
+        return self._client
+
+    def close(self) -> None:
+        """Close the client; the next get() opens a new one."""
+        with self._lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
@@ -4,9 +4,11 @@ from typing import Optional
 
 import httpx
 
+from devsync.llm.http_client import PooledHTTPClient
 from devsync.llm.provider import LLMProvider, LLMProviderError, LLMResponse
 
 _API_URL = "https://api.openai.com/v1/chat/completions"
+_MODELS_URL = "https://api.openai.com/v1/models"
 _DEFAULT_MODEL = "gpt-4o"
 
 
@@ -19,6 +21,7 @@ class OpenAIProvider(LLMProvider):
     def __init__(self, api_key: str, model: Optional[str] = None):
         self._api_key = api_key
         self._model = model or _DEFAULT_MODEL
+        self._http = PooledHTTPClient()
 
     @property
     def name(self) -> str:
@@ -56,8 +59,7 @@ class OpenAIProvider(LLMProvider):
         }
 
         try:
-            with httpx.Client(timeout=120.0) as client:
-                response = client.post(_API_URL, headers=headers, json=body)
+            response = self._http.get().post(_API_URL, headers=headers, json=body)
         except httpx.HTTPError as e:
             raise LLMProviderError(f"HTTP error calling OpenAI API: {e}") from e
 
@@ -90,9 +92,14 @@ class OpenAIProvider(LLMProvider):
             raw_response=raw,
         )
 
+    def close(self) -> None:
+        self._http.close()
+
     def validate_api_key(self) -> bool:
+        # Listing models is authenticated but generates nothing, so no tokens are billed
+        headers = {"Authorization": f"Bearer {self._api_key}"}
         try:
-            self.complete("Say 'ok'.", max_tokens=10)
-            return True
-        except LLMProviderError:
+            response = self._http.get().get(_MODELS_URL, headers=headers)
+        except httpx.HTTPError:
             return False
+        return response.status_code == 200
@@ -4,6 +4,7 @@ from typing import Optional
 
 import httpx
 
+from devsync.llm.http_client import PooledHTTPClient
 from devsync.llm.provider import LLMProvider, LLMProviderError, LLMResponse
 
 _API_URL = "https://openrouter.ai/api/v1/chat/completions"
@@ -19,6 +20,7 @@ class OpenRouterProvider(LLMProvider):
     def __init__(self, api_key: str, model: Optional[str] = None):
         self._api_key = api_key
         self._model = model or _DEFAULT_MODEL
+        self._http = PooledHTTPClient()
 
     @property
     def name(self) -> str:
@@ -58,8 +60,7 @@ class OpenRouterProvider(LLMProvider):
         }
 
         try:
-            with httpx.Client(timeout=120.0) as client:
-                response = client.post(_API_URL, headers=headers, json=body)
+            response = self._http.get().post(_API_URL, headers=headers, json=body)
         except httpx.HTTPError as e:
             raise LLMProviderError(f"HTTP error calling OpenRouter API: {e}") from e
 
@@ -92,6 +93,9 @@ class OpenRouterProvider(LLMProvider):
             raw_response=raw,
         )
 
+    def close(self) -> None:
+        self._http.close()
+
     def validate_api_key(self) -> bool:
         try:
             self.complete("Say 'ok'.", max_tokens=10)
@@ -62,13 +62,13 @@ Respond with a JSON object:
   "pip_package": "package-name>=1.0 (if pip-installable, null otherwise)"
 }}"""
 
+# The adaptation prompts put the per-practice JSON last so that every request in
+# one run shares the same prefix (instructions plus existing rules), which
+# providers with automatic prompt caching can reuse across batches.
 ADAPT_PRACTICE_PROMPT = """\
 You are adapting a coding practice for installation into a project that already has \
 existing rules.
 
-Incoming practice:
-{practice_json}
-
 Existing rules in the target project:
 {existing_rules}
 
@@ -85,7 +85,40 @@ Respond with a JSON object:
   "reason": "explanation",
   "merged_content": "merged instruction text (only if action=merge)",
   "file_name": "suggested-filename.md"
-}}"""
+}}
+
+Incoming practice:
+{practice_json}"""
+
+ADAPT_PRACTICES_BATCH_PROMPT = """\
+You are adapting several coding practices for installation into a project that \
+already has existing rules.
+
+Existing rules in the target project:
+{existing_rules}
+
+Target AI tool: {tool_name}
+
+For EACH incoming practice, determine the best adaptation strategy:
+1. "install" — no conflict, install as-is
+2. "merge" — overlapping content, produce merged version
+3. "skip" — existing rules already cover this practice
+
+Respond with a JSON object containing one entry per incoming practice:
+{{
+  "adaptations": [
+    {{
+      "practice_name": "name of the incoming practice",
+      "action": "install|merge|skip",
+      "reason": "explanation",
+      "merged_content": "merged instruction text (only if action=merge)",
+      "file_name": "suggested-filename.md"
+    }}
+  ]
+}}
+
+Incoming practices (JSON array, one object per practice):
+{practices_json}"""
 
 MERGE_PRACTICES_PROMPT = """\
 Merge the following two instruction documents into a single coherent document.
@@ -114,7 +147,11 @@ def format_files_for_extraction(files: dict[str, str]) -> str:
     Returns:
         Formatted string with file separators.
     """
-    parts = []
+    # Join the file contents directly rather than copying each one into a
+    # per-file string first; large rule files are then copied only once.
+    pieces: list[str] = []
     for path, content in files.items():
-        parts.append(f"--- {path} ---\n{content}\n")
-    return "\n".join(parts)
+        pieces.extend((f"--- {path} ---\n", content, "\n\n"))
+    if pieces:
+        pieces[-1] = "\n"
+    return "".join(pieces)
@@ -73,6 +73,16 @@ class LLMProvider(ABC):
             True if the key is valid, False otherwise.
         """
 
+    def close(self) -> None:
+        """Release pooled resources such as open HTTP connections."""
+
+    def confirm_response(self, response: LLMResponse) -> None:
+        """Mark a response from ``complete`` as parsed and validated by the caller.
+
+        Providers that cache responses store them only once confirmed, so a
+        malformed reply is never replayed. The default does nothing.
+        """
+
 
 class LLMProviderError(Exception):
     """Raised when an LLM API call fails."""
@@ -83,11 +93,12 @@ class LLMProviderError(Exception):
         self.raw_response = raw_response
 
 
-_PROVIDER_ENV_VARS = [
-    ("anthropic", "ANTHROPIC_API_KEY"),
-    ("openai", "OPENAI_API_KEY"),
-    ("openrouter", "OPENROUTER_API_KEY"),
-]
+# Provider name -> API key env var, in auto-detection priority order
+_PROVIDER_ENV_VARS = {
+    "anthropic": "ANTHROPIC_API_KEY",
+    "openai": "OPENAI_API_KEY",
+    "openrouter": "OPENROUTER_API_KEY",
+}
 
 
 def resolve_provider(
@@ -106,32 +117,51 @@ def resolve_provider(
     Returns:
         An LLMProvider instance, or None if no API key is found.
     """
-    from devsync.llm.anthropic import AnthropicProvider
-    from devsync.llm.openai_provider import OpenAIProvider
-    from devsync.llm.openrouter import OpenRouterProvider
-
-    provider_map: dict[str, type[LLMProvider]] = {
-        "anthropic": AnthropicProvider,
-        "openai": OpenAIProvider,
-        "openrouter": OpenRouterProvider,
-    }
-
     if preferred_provider:
-        provider_cls = provider_map.get(preferred_provider)
-        if not provider_cls:
-            return None
-        env_var = next((ev for name, ev in _PROVIDER_ENV_VARS if name == preferred_provider), None)
+        env_var = _PROVIDER_ENV_VARS.get(preferred_provider)
         if not env_var:
             return None
         api_key = os.environ.get(env_var)
         if not api_key:
             return None
-        return provider_cls(api_key=api_key, model=preferred_model)  # type: ignore[call-arg]
+        return _build_provider(preferred_provider, api_key, preferred_model, _response_cache_enabled())
 
-    for provider_name, env_var in _PROVIDER_ENV_VARS:
+    for provider_name, env_var in _PROVIDER_ENV_VARS.items():
         api_key = os.environ.get(env_var)
         if api_key:
-            provider_cls = provider_map[provider_name]
-            return provider_cls(api_key=api_key, model=preferred_model)  # type: ignore[call-arg]
+            return _build_provider(provider_name, api_key, preferred_model, _response_cache_enabled())
 
     return None
+
+
+def _response_cache_enabled() -> bool:
+    """Whether DEVSYNC_LLM_CACHE opts in to the on-disk response cache."""
+    from devsync.llm.cache import LLM_CACHE_ENV_VAR
+
+    return os.environ.get(LLM_CACHE_ENV_VAR) == "1"
+
+
+def _build_provider(provider_name: str, api_key: str, model: Optional[str], cached: bool = False) -> LLMProvider:
+    """Instantiate the named provider, wrapped in the response cache when enabled."""
+    # Import only the selected provider's module
+    provider_cls: type[LLMProvider]
+    if provider_name == "anthropic":
+        from devsync.llm.anthropic import AnthropicProvider
+
+        provider_cls = AnthropicProvider
+    elif provider_name == "openai":
+        from devsync.llm.openai_provider import OpenAIProvider
+
+        provider_cls = OpenAIProvider
+    elif provider_name == "openrouter":
+        from devsync.llm.openrouter import OpenRouterProvider
+
+        provider_cls = OpenRouterProvider
+    else:
+        raise KeyError(provider_name)
+    provider = provider_cls(api_key=api_key, model=model)  # type: ignore[call-arg]
+    if cached:
+        from devsync.llm.cache import CachedLLMProvider
+
+        return CachedLLMProvider(provider)
+    return provider
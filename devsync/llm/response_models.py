@@ -114,6 +114,29 @@ class MergeDecision:
         }
 
 
+_ADAPTATION_ACTIONS = frozenset({"install", "merge", "skip"})
+
+
+def _is_adaptation_action(value: object) -> bool:
+    """Whether ``value`` is one of the known action strings."""
+    return isinstance(value, str) and value in _ADAPTATION_ACTIONS
+
+
+def _decode_response_object(raw_json: str) -> dict:
+    """Decode an LLM response that must be a JSON object.
+
+    Raises:
+        ValueError: If the text is not valid JSON or is not a JSON object.
+    """
+    try:
+        data = json.loads(raw_json)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON in LLM response: {e}") from e
+    if not isinstance(data, dict):
+        raise ValueError(f"Expected a JSON object in LLM response, got {type(data).__name__}")
+    return data
+
+
 def parse_extraction_response(raw_json: str) -> list[PracticeDeclaration]:
     """Parse LLM extraction response into PracticeDeclaration list.
 
@@ -126,13 +149,20 @@ def parse_extraction_response(raw_json: str) -> list[PracticeDeclaration]:
     Raises:
         ValueError: If JSON is invalid or missing required fields.
     """
-    try:
-        data = json.loads(raw_json)
-    except json.JSONDecodeError as e:
-        raise ValueError(f"Invalid JSON in LLM response: {e}") from e
+    data = _decode_response_object(raw_json)
+
+    items = data.get("practices", [])
+    if not isinstance(items, list):
+        raise ValueError("LLM response 'practices' must be a list")
 
     practices = []
-    for item in data.get("practices", []):
+    for index, item in enumerate(items):
+        if (
+            not isinstance(item, dict)
+            or not isinstance(item.get("name"), str)
+            or not isinstance(item.get("intent"), str)
+        ):
+            raise ValueError(f"LLM response practice #{index} must be an object with string 'name' and 'intent'")
         practices.append(PracticeDeclaration.from_dict(item))
     return practices
 
@@ -149,13 +179,14 @@ def parse_adaptation_response(raw_json: str) -> AdaptationAction:
     Raises:
         ValueError: If JSON is invalid or missing required fields.
     """
-    try:
-        data = json.loads(raw_json)
-    except json.JSONDecodeError as e:
-        raise ValueError(f"Invalid JSON in LLM response: {e}") from e
+    data = _decode_response_object(raw_json)
+
+    action = data.get("action", "skip")
+    if not _is_adaptation_action(action):
+        raise ValueError(f"Unknown adaptation action in LLM response: {action!r}")
 
     return AdaptationAction(
-        action=data.get("action", "skip"),
+        action=action,
         practice_name=data.get("practice_name", ""),
         reason=data.get("reason", ""),
         file_name=data.get("file_name", ""),
@@ -163,6 +194,39 @@ def parse_adaptation_response(raw_json: str) -> AdaptationAction:
     )
 
 
+def parse_batch_adaptation_response(raw_json: str) -> list[AdaptationAction]:
+    """Parse a batched LLM adaptation response into AdaptationAction objects.
+
+    Args:
+        raw_json: JSON string from LLM response.
+
+    Returns:
+        List of AdaptationAction objects, one per well-formed entry in
+        ``adaptations``. Entries that are not objects or name an unknown
+        action are dropped.
+
+    Raises:
+        ValueError: If JSON is invalid or missing required fields.
+    """
+    data = _decode_response_object(raw_json)
+
+    items = data.get("adaptations")
+    if not isinstance(items, list):
+        raise ValueError("LLM response is missing the 'adaptations' list")
+
+    return [
+        AdaptationAction(
+            action=item.get("action", "skip"),
+            practice_name=item.get("practice_name", ""),
+            reason=item.get("reason", ""),
+            file_name=item.get("file_name", ""),
+            content=item.get("merged_content", ""),
+        )
+        for item in items
+        if isinstance(item, dict) and _is_adaptation_action(item.get("action", "skip"))
+    ]
+
+
 def parse_merge_response(raw_json: str) -> MergeDecision:
     """Parse LLM merge response into a MergeDecision.
 
@@ -175,10 +239,7 @@ def parse_merge_response(raw_json: str) -> MergeDecision:
     Raises:
         ValueError: If JSON is invalid or missing required fields.
     """
-    try:
-        data = json.loads(raw_json)
-    except json.JSONDecodeError as e:
-        raise ValueError(f"Invalid JSON in LLM response: {e}") from e
+    data = _decode_response_object(raw_json)
 
     return MergeDecision(
         merged_content=data.get("merged_content", ""),
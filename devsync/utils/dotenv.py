@@ -1,13 +1,17 @@
 """Utilities for .env file manipulation."""
 
+import io
 import re
 from pathlib import Path
 
 from dotenv import dotenv_values, set_key
+from dotenv.parser import parse_stream
 
 from devsync.core.models import EnvironmentConfig, InstallationScope
 from devsync.utils.atomic_write import atomic_write
 
+_ENV_KEY_PATTERN = re.compile(r"^[A-Z][A-Z0-9_]*$")
+
 
 def load_env_config(env_path: Path, scope: InstallationScope) -> EnvironmentConfig:
     """
@@ -69,7 +73,7 @@ def set_env_variable(env_path: Path, key: str, value: str) -> None:
         value: Variable value
     """
     # Validate key format
-    if not re.match(r"^[A-Z][A-Z0-9_]*$", key):
+    if not _ENV_KEY_PATTERN.match(key):
         raise ValueError(f"Invalid environment variable name: {key}. Must match ^[A-Z][A-Z0-9_]*$")
 
     env_path.parent.mkdir(parents=True, exist_ok=True)
@@ -81,6 +85,57 @@ def set_env_variable(env_path: Path, key: str, value: str) -> None:
     set_key(str(env_path), key, value, quote_mode="always")
 
 
+def set_env_variables(env_path: Path, variables: dict[str, str]) -> None:
+    """
+    Set several environment variables in .env file with one read and one write.
+
+    Produces the same file as calling set_env_variable once per variable:
+    existing lines are kept, lines for the given keys are replaced in place,
+    and new keys are appended in order. The file is replaced atomically.
+
+    Args:
+        env_path: Path to .env file
+        variables: Variable name (UPPERCASE_WITH_UNDERSCORES) to value mapping
+
+    Raises:
+        ValueError: If any variable name is invalid (nothing is written)
+    """
+    for key in variables:
+        if not _ENV_KEY_PATTERN.match(key):
+            raise ValueError(f"Invalid environment variable name: {key}. Must match ^[A-Z][A-Z0-9_]*$")
+    if not variables:
+        return
+
+    env_path.parent.mkdir(parents=True, exist_ok=True)
+    ensure_env_gitignored(env_path)
+
+    try:
+        existing = env_path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        existing = ""
+
+    lines: list[str] = []
+    pending = dict(variables)
+    for mapping in parse_stream(io.StringIO(existing)):
+        if mapping.key in variables:
+            lines.append(_quoted_env_line(mapping.key, variables[mapping.key]))
+            pending.pop(mapping.key, None)
+        else:
+            lines.append(mapping.original.string)
+    if pending and lines and not lines[-1].endswith("\n"):
+        lines.append("\n")
+    lines.extend(_quoted_env_line(key, value) for key, value in pending.items())
+
+    with atomic_write(env_path, mode="w", encoding="utf-8", create_backup=False) as f:
+        f.write("".join(lines))
+
+
+def _quoted_env_line(key: str, value: str) -> str:
+    """Format a line the way python-dotenv's set_key does with quote_mode="always"."""
+    escaped = value.replace("\\", "\\\\").replace("'", "\\'")
+    return f"{key}='{escaped}'\n"
+
+
 def ensure_env_gitignored(env_path: Path) -> None:
     """
     Ensure .env file is in .gitignore.
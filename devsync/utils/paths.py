@@ -194,7 +194,8 @@ def get_installation_tracker_path() -> Path:
 
 def ensure_directory_exists(path: Path) -> None:
     """Ensure a directory exists, creating it if necessary."""
-    path.mkdir(parents=True, exist_ok=True)
+    if not path.is_dir():
+        path.mkdir(parents=True, exist_ok=True)
 
 
 def safe_file_name(name: str) -> str:
@@ -5,6 +5,21 @@ from typing import Optional
 
 from devsync.utils.paths import _resolve_data_dir
 
+# Common project markers
+_PROJECT_MARKERS = (
+    ".git",
+    "pyproject.toml",
+    "package.json",
+    "Cargo.toml",
+    "go.mod",
+    "pom.xml",
+    "build.gradle",
+    "composer.json",
+    "Gemfile",
+    ".project",  # Eclipse project
+    "Makefile",
+)
+
 
 def find_project_root(start_path: Optional[Path] = None) -> Optional[Path]:
     """
@@ -33,26 +48,11 @@ def find_project_root(start_path: Optional[Path] = None) -> Optional[Path]:
     else:
         start_path = Path(start_path).resolve()
 
-    # Common project markers
-    markers = [
-        ".git",
-        "pyproject.toml",
-        "package.json",
-        "Cargo.toml",
-        "go.mod",
-        "pom.xml",
-        "build.gradle",
-        "composer.json",
-        "Gemfile",
-        ".project",  # Eclipse project
-        "Makefile",
-    ]
-
     current = start_path
 
     # Search upward through parent directories
     while True:
-        for marker in markers:
+        for marker in _PROJECT_MARKERS:
             marker_path = current / marker
             if marker_path.exists():
                 return current
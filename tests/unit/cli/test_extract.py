@@ -4,11 +4,15 @@ import warnings
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
 import yaml
 
 from devsync.cli.extract import (
+    _copy_source_files,
     _display_detection_summary,
     _get_detection_rows,
+    _instruction_refs,
+    _read_if_small,
     _upgrade_v1_package,
     extract_command,
 )
@@ -341,6 +345,12 @@ class TestUpgradeV1Package:
         result = _upgrade_v1_package(str(tmp_path))
         assert result == 0
 
+    def test_upgrade_malformed_v2_not_parsed(self, tmp_path: Path) -> None:
+        """Test an existing v2 manifest is reported without being parsed."""
+        (tmp_path / "devsync-package.yaml").write_text("- not\n- a mapping\n")
+        result = _upgrade_v1_package(str(tmp_path))
+        assert result == 0
+
     def test_upgrade_v1_no_ai(self, tmp_path: Path) -> None:
         instructions_dir = tmp_path / "instructions"
         instructions_dir.mkdir()
@@ -389,3 +399,67 @@ class TestUpgradeV1Package:
 
         assert result == 0
         assert (output_dir / "devsync-package.yaml").exists()
+
+
+class TestCopySourceFiles:
+    def test_copies_contents_into_instructions_dir(self, tmp_path: Path) -> None:
+        src_dir = tmp_path / "src"
+        src_dir.mkdir()
+        for i in range(5):
+            (src_dir / f"rule{i}.md").write_text(f"# Rule {i}")
+
+        out = tmp_path / "out"
+        _copy_source_files(src_dir, out, [f"rule{i}.md" for i in range(5)] + ["missing.md"])
+
+        copied = sorted(p.name for p in (out / "instructions").iterdir())
+        assert copied == [f"rule{i}.md" for i in range(5)]
+        assert (out / "instructions" / "rule3.md").read_text() == "# Rule 3"
+
+    def test_same_name_last_file_wins(self, tmp_path: Path) -> None:
+        (tmp_path / "a").mkdir()
+        (tmp_path / "b").mkdir()
+        (tmp_path / "a" / "rule.md").write_text("first")
+        (tmp_path / "b" / "rule.md").write_text("second")
+
+        out = tmp_path / "out"
+        _copy_source_files(tmp_path, out, ["a/rule.md", "b/rule.md"])
+
+        assert (out / "instructions" / "rule.md").read_text() == "second"
+
+    def test_same_name_missing_last_file_keeps_earlier(self, tmp_path: Path) -> None:
+        (tmp_path / "a").mkdir()
+        (tmp_path / "a" / "rule.md").write_text("first")
+
+        out = tmp_path / "out"
+        _copy_source_files(tmp_path, out, ["a/rule.md", "b/rule.md"])
+
+        assert (out / "instructions" / "rule.md").read_text() == "first"
+
+
+class TestReadIfSmall:
+    def test_reads_text(self, tmp_path: Path) -> None:
+        path = tmp_path / "rule.md"
+        path.write_bytes(b"# Rule\r\nLine two\r")
+        assert _read_if_small(path) == "# Rule\nLine two\n"
+
+    def test_missing_or_oversized_returns_none(self, tmp_path: Path) -> None:
+        path = tmp_path / "big.md"
+        path.write_text("x" * 10)
+        assert _read_if_small(tmp_path / "missing.md") is None
+        assert _read_if_small(path, limit=10) is None
+        assert _read_if_small(path, limit=11) == "x" * 10
+
+    def test_invalid_utf8_raises(self, tmp_path: Path) -> None:
+        path = tmp_path / "bad.md"
+        path.write_bytes(b"\xff\xfe")
+        with pytest.raises(UnicodeDecodeError):
+            _read_if_small(path)
+
+
+class TestInstructionRefs:
+    def test_refs_point_into_instructions_dir(self) -> None:
+        refs = _instruction_refs([".claude/rules/style.md", "rules/api.v2.mdc"])
+        assert [(r.name, r.file) for r in refs] == [
+            ("style", "instructions/style.md"),
+            ("api.v2", "instructions/api.v2.mdc"),
+        ]
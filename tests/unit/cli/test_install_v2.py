@@ -1,16 +1,23 @@
 """Tests for install v2 CLI command."""
 
+import os
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import yaml
 
 from devsync.cli.install_v2 import (
-    _get_tool_instruction_path,
+    _display_plan,
+    _execute_plan,
     _install_pip_dependencies,
+    _install_v2_fallback,
+    _is_safe_instruction_name,
     _resolve_source,
+    _tool_instruction_dirs,
     install_v2_command,
 )
+from devsync.core.package_manifest_v2 import ComponentRef, PackageManifestV2
+from devsync.llm.response_models import AdaptationAction, AdaptationPlan
 
 
 class TestResolveSource:
@@ -22,21 +29,30 @@ class TestResolveSource:
         result = _resolve_source("/definitely/not/a/real/path/xyz123")
         assert result is None
 
+    def test_git_url_cloned_shallow_without_tags(self) -> None:
+        with patch("devsync.core.git_operations.GitOperations.clone_repository") as mock_clone:
+            result = _resolve_source("https://github.com/user/repo.git")
 
-class TestGetToolInstructionPath:
-    def test_claude_path(self, tmp_path: Path) -> None:
-        result = _get_tool_instruction_path("claude", tmp_path, "test-rule")
         assert result is not None
-        assert result == tmp_path / ".claude" / "rules" / "test-rule.md"
+        result.rmdir()
+        assert mock_clone.call_args.kwargs == {"depth": 1, "no_tags": True}
 
-    def test_cursor_path(self, tmp_path: Path) -> None:
-        result = _get_tool_instruction_path("cursor", tmp_path, "test-rule")
-        assert result is not None
-        assert result == tmp_path / ".cursor" / "rules" / "test-rule.mdc"
 
-    def test_unknown_tool_returns_none(self, tmp_path: Path) -> None:
-        result = _get_tool_instruction_path("unknown-tool", tmp_path, "test")
-        assert result is None
+class TestToolInstructionDirs:
+    def test_claude_dir(self, tmp_path: Path) -> None:
+        assert _tool_instruction_dirs(tmp_path, ["claude"]) == [(tmp_path / ".claude" / "rules", ".md")]
+
+    def test_cursor_dir(self, tmp_path: Path) -> None:
+        assert _tool_instruction_dirs(tmp_path, ["cursor"]) == [(tmp_path / ".cursor" / "rules", ".mdc")]
+
+    def test_unknown_tools_dropped(self, tmp_path: Path) -> None:
+        dirs = _tool_instruction_dirs(tmp_path, ["cursor", "unknown-tool", "claude"])
+        assert dirs == [(tmp_path / ".cursor/rules", ".mdc"), (tmp_path / ".claude/rules", ".md")]
+
+    def test_traversal_names_rejected(self) -> None:
+        for name in ("../evil", "sub/rule", "sub\\rule"):
+            assert not _is_safe_instruction_name(name)
+        assert _is_safe_instruction_name("test-rule")
 
 
 class TestInstallPipDependencies:
@@ -73,7 +89,7 @@ class TestInstallPipDependencies:
         result = _install_pip_dependencies(servers, skip_pip=False)
         assert result == set()
 
-    @patch("devsync.cli.install_v2.Confirm.ask", return_value=False)
+    @patch("rich.prompt.Confirm.ask", return_value=False)
     @patch("devsync.core.pip_utils.installed_version_satisfies", return_value=False)
     @patch("devsync.core.pip_utils.validate_pip_spec", return_value=True)
     def test_user_declines_returns_failed(
@@ -84,7 +100,7 @@ class TestInstallPipDependencies:
         assert "declined-mcp" in result
 
     @patch("devsync.core.pip_utils.install_pip_package", return_value=(True, "Successfully installed mcp-server>=1.0"))
-    @patch("devsync.cli.install_v2.Confirm.ask", return_value=True)
+    @patch("rich.prompt.Confirm.ask", return_value=True)
     @patch("devsync.core.pip_utils.installed_version_satisfies", return_value=False)
     @patch("devsync.core.pip_utils.validate_pip_spec", return_value=True)
     def test_install_success(
@@ -96,7 +112,7 @@ class TestInstallPipDependencies:
         mock_install.assert_called_once_with("mcp-server>=1.0")
 
     @patch("devsync.core.pip_utils.install_pip_package", return_value=(False, "Package not found: bad-pkg"))
-    @patch("devsync.cli.install_v2.Confirm.ask", return_value=True)
+    @patch("rich.prompt.Confirm.ask", return_value=True)
     @patch("devsync.core.pip_utils.installed_version_satisfies", return_value=False)
     @patch("devsync.core.pip_utils.validate_pip_spec", return_value=True)
     def test_install_failure_returns_failed(
@@ -107,6 +123,47 @@ class TestInstallPipDependencies:
         assert "fail-mcp" in result
         mock_install.assert_called_once_with("bad-pkg")
 
+    @patch("devsync.core.pip_utils.install_pip_package")
+    @patch("devsync.core.pip_utils.install_pip_packages", return_value=(True, "Successfully installed a, b"))
+    @patch("rich.prompt.Confirm.ask", return_value=True)
+    @patch("devsync.core.pip_utils.installed_version_satisfies", return_value=False)
+    @patch("devsync.core.pip_utils.validate_pip_spec", return_value=True)
+    def test_approved_specs_installed_together(
+        self,
+        mock_validate: MagicMock,
+        mock_satisfies: MagicMock,
+        mock_ask: MagicMock,
+        mock_batch: MagicMock,
+        mock_install: MagicMock,
+    ) -> None:
+        servers = [
+            self._make_server(name="a-mcp", pip_package="a"),
+            self._make_server(name="b-mcp", pip_package="b"),
+            self._make_server(name="a2-mcp", pip_package="a"),
+        ]
+        result = _install_pip_dependencies(servers, skip_pip=False)
+        assert result == set()
+        mock_batch.assert_called_once_with(["a", "b"])
+        mock_install.assert_not_called()
+
+    @patch("devsync.core.pip_utils.install_pip_package", side_effect=[(True, "ok a"), (False, "Package not found: b")])
+    @patch("devsync.core.pip_utils.install_pip_packages", return_value=(False, "Package not found: a, b"))
+    @patch("rich.prompt.Confirm.ask", return_value=True)
+    @patch("devsync.core.pip_utils.installed_version_satisfies", return_value=False)
+    @patch("devsync.core.pip_utils.validate_pip_spec", return_value=True)
+    def test_batch_failure_retries_each_spec(
+        self,
+        mock_validate: MagicMock,
+        mock_satisfies: MagicMock,
+        mock_ask: MagicMock,
+        mock_batch: MagicMock,
+        mock_install: MagicMock,
+    ) -> None:
+        servers = [self._make_server(name="a-mcp", pip_package="a"), self._make_server(name="b-mcp", pip_package="b")]
+        result = _install_pip_dependencies(servers, skip_pip=False)
+        assert result == {"b-mcp"}
+        assert [c.args[0] for c in mock_install.call_args_list] == ["a", "b"]
+
 
 class TestInstallV2Command:
     def test_install_nonexistent_source(self) -> None:
@@ -117,9 +174,19 @@ class TestInstallV2Command:
         result = install_v2_command(source=str(tmp_path))
         assert result == 1
 
+    def test_cloned_source_removed_after_install(self, tmp_path: Path) -> None:
+        clone_dir = tmp_path / "clone"
+        (clone_dir / "nested").mkdir(parents=True)
+        (clone_dir / "nested" / "file.txt").write_text("x")
+        with patch("devsync.cli.install_v2._resolve_source", return_value=clone_dir):
+            result = install_v2_command(source="https://github.com/user/repo.git")
+
+        assert result == 1
+        assert not clone_dir.exists()
+
     @patch("devsync.cli.install_v2.find_project_root")
     @patch("devsync.cli.install_v2._resolve_tools", return_value=["claude"])
-    @patch("devsync.cli.install_v2.Confirm.ask", return_value=False)
+    @patch("rich.prompt.Confirm.ask", return_value=False)
     def test_install_v1_package_file_copy(
         self, mock_confirm: MagicMock, mock_tools: MagicMock, mock_root: MagicMock, tmp_path: Path
     ) -> None:
@@ -152,3 +219,149 @@ class TestInstallV2Command:
         installed = project_dir / ".claude" / "rules" / "style.md"
         assert installed.exists()
         assert "Use black" in installed.read_text()
+
+
+class TestDisplayPlan:
+    @patch("devsync.cli.install_v2.console")
+    def test_summary_counts_each_action(self, mock_console: MagicMock) -> None:
+        plan = AdaptationPlan(
+            actions=[
+                AdaptationAction(action="install", practice_name="a", reason=""),
+                AdaptationAction(action="install", practice_name="b", reason=""),
+                AdaptationAction(action="skip", practice_name="c", reason=""),
+            ]
+        )
+
+        _display_plan(plan)
+
+        summary = mock_console.print.call_args_list[-1][0][0]
+        assert "Install: 2 | Merge: 0 | Skip: 1" in summary
+
+
+class TestExecutePlan:
+    def test_writes_each_tool_and_skips_skips(self, tmp_path: Path) -> None:
+        plan = AdaptationPlan(
+            actions=[
+                AdaptationAction(action="install", practice_name="style", reason="", content="# Style"),
+                AdaptationAction(action="merge", practice_name="tests", reason="", content="# Tests"),
+                AdaptationAction(action="skip", practice_name="docs", reason="", content="# Docs"),
+            ]
+        )
+
+        _execute_plan(plan, tmp_path, ["claude", "cursor"])
+
+        assert (tmp_path / ".claude" / "rules" / "style.md").read_text() == "# Style"
+        assert (tmp_path / ".cursor" / "rules" / "tests.mdc").read_text() == "# Tests"
+        assert not (tmp_path / ".claude" / "rules" / "docs.md").exists()
+
+    def test_last_action_for_same_file_wins(self, tmp_path: Path) -> None:
+        plan = AdaptationPlan(
+            actions=[
+                AdaptationAction(action="install", practice_name="style", reason="", content="first"),
+                AdaptationAction(action="merge", practice_name="style", reason="", content="second"),
+            ]
+        )
+
+        _execute_plan(plan, tmp_path, ["claude"])
+
+        assert (tmp_path / ".claude" / "rules" / "style.md").read_text() == "second"
+
+    def test_reports_installed_files_in_one_print(self, tmp_path: Path) -> None:
+        plan = AdaptationPlan(
+            actions=[
+                AdaptationAction(action="install", practice_name="style", reason="", content="# Style"),
+                AdaptationAction(action="install", practice_name="tests", reason="", content="# Tests"),
+            ]
+        )
+
+        with patch("devsync.cli.install_v2.console") as mock_console:
+            _execute_plan(plan, tmp_path, ["claude", "cursor"])
+
+        mock_console.print.assert_called_once()
+        assert mock_console.print.call_args.args[0].count("Installed:") == 4
+
+    def test_shared_content_encoded_once(self, tmp_path: Path) -> None:
+        plan = AdaptationPlan(
+            actions=[AdaptationAction(action="install", practice_name="style", reason="", content="# Style\nUse hints")]
+        )
+
+        with patch.object(Path, "write_bytes", autospec=True) as mock_write:
+            _execute_plan(plan, tmp_path, ["claude", "cursor", "windsurf"])
+
+        payloads = [c.args[1] for c in mock_write.call_args_list]
+        assert len(payloads) == 3
+        assert all(p is payloads[0] for p in payloads)
+        assert payloads[0] == "# Style\nUse hints".replace("\n", os.linesep).encode("utf-8")
+
+
+class TestInstallV2Fallback:
+    def _make_package(self, tmp_path: Path, names: list[str]) -> tuple[PackageManifestV2, Path]:
+        pkg_dir = tmp_path / "package"
+        (pkg_dir / "instructions").mkdir(parents=True)
+        refs = []
+        for index, name in enumerate(names):
+            rel = f"instructions/{name}-{index}.md"
+            (pkg_dir / rel).write_text(f"content {index}")
+            refs.append(ComponentRef(name=name, file=rel))
+        return PackageManifestV2(format_version="1.0", name="pkg", components={"instructions": refs}), pkg_dir
+
+    def test_rename_accounts_for_files_planned_in_same_run(self, tmp_path: Path) -> None:
+        manifest, pkg_dir = self._make_package(tmp_path, ["style", "style", "style"])
+        project = tmp_path / "project"
+        rules = project / ".claude" / "rules"
+        rules.mkdir(parents=True)
+        (rules / "style.md").write_text("existing")
+
+        _install_v2_fallback(manifest, pkg_dir, project, ["claude"], "rename")
+
+        assert (rules / "style.md").read_text() == "existing"
+        assert (rules / "style-1.md").read_text() == "content 0"
+        assert (rules / "style-2.md").read_text() == "content 1"
+        assert (rules / "style-3.md").read_text() == "content 2"
+
+    def test_skip_treats_planned_files_as_existing(self, tmp_path: Path) -> None:
+        manifest, pkg_dir = self._make_package(tmp_path, ["style", "style"])
+        project = tmp_path / "project"
+
+        _install_v2_fallback(manifest, pkg_dir, project, ["claude", "cursor"], "skip")
+
+        assert (project / ".claude" / "rules" / "style.md").read_text() == "content 0"
+        assert (project / ".cursor" / "rules" / "style.mdc").read_text() == "content 0"
+
+    def test_missing_source_reported_and_skipped(self, tmp_path: Path) -> None:
+        manifest, pkg_dir = self._make_package(tmp_path, ["style", "testing"])
+        (pkg_dir / "instructions" / "style-0.md").unlink()
+        project = tmp_path / "project"
+
+        with patch("devsync.cli.install_v2.console") as mock_console:
+            _install_v2_fallback(manifest, pkg_dir, project, ["claude"], "skip")
+
+        printed = "\n".join(c.args[0] for c in mock_console.print.call_args_list)
+        assert "  [yellow]Missing: instructions/style-0.md[/yellow]\n" in printed
+        assert not (project / ".claude" / "rules" / "style.md").exists()
+        assert (project / ".claude" / "rules" / "testing.md").read_text() == "content 1"
+
+    def test_path_traversal_rejected(self, tmp_path: Path) -> None:
+        pkg_dir = tmp_path / "package"
+        pkg_dir.mkdir()
+        (tmp_path / "outside.md").write_text("secret")
+        refs = [ComponentRef(name="outside", file="../outside.md")]
+        manifest = PackageManifestV2(format_version="1.0", name="pkg", components={"instructions": refs})
+        project = tmp_path / "project"
+
+        _install_v2_fallback(manifest, pkg_dir, project, ["claude"], "skip")
+
+        assert not (project / ".claude" / "rules" / "outside.md").exists()
+
+
+class TestInstallV2Imports:
+    def test_module_import_skips_ai_modules(self) -> None:
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, devsync.cli.install_v2; "
+            "print(any(m in sys.modules for m in ('devsync.core.adapter', 'devsync.llm.provider', 'rich.table')))"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == "False"
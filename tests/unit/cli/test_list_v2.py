@@ -1,7 +1,10 @@
 """Tests for v2 list command."""
 
+import json
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from devsync.cli.list_v2 import list_v2_command
 
 
@@ -39,3 +42,33 @@ class TestListV2Command:
         mock_tracker_cls.return_value.get_installed_packages.side_effect = Exception("No file")
         result = list_v2_command()
         assert result == 0
+
+    @patch("devsync.cli.list_v2.find_project_root", return_value=None)
+    @patch("devsync.cli.list_v2.PackageTracker")
+    def test_tool_filter_is_case_insensitive(
+        self, mock_tracker_cls: MagicMock, mock_root: MagicMock, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        cursor_pkg = MagicMock(components=[MagicMock(ai_tool="Cursor")])
+        cursor_pkg.to_dict.return_value = {"name": "cursor-pkg"}
+        claude_pkg = MagicMock(components=[MagicMock(ai_tool="claude")])
+        claude_pkg.to_dict.return_value = {"name": "claude-pkg"}
+        mock_tracker_cls.return_value.get_installed_packages.return_value = [cursor_pkg, claude_pkg]
+
+        result = list_v2_command(tool="CURSOR", json=True)
+
+        assert result == 0
+        assert json.loads(capsys.readouterr().out) == [{"name": "cursor-pkg"}]
+
+    @patch("devsync.cli.list_v2.find_project_root", return_value=None)
+    @patch("devsync.cli.list_v2.PackageTracker")
+    def test_json_output_is_not_wrapped(
+        self, mock_tracker_cls: MagicMock, mock_root: MagicMock, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        description = "word " * 60 + "[bold]literal[/bold]"
+        pkg = MagicMock()
+        pkg.to_dict.return_value = {"name": "pkg", "description": description}
+        mock_tracker_cls.return_value.get_installed_packages.return_value = [pkg]
+
+        list_v2_command(json=True)
+
+        assert json.loads(capsys.readouterr().out) == [{"name": "pkg", "description": description}]
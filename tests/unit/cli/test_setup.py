@@ -64,6 +64,7 @@ class TestSetupCommand:
         with patch("devsync.cli.setup.resolve_provider", return_value=mock_provider):
             result = setup_command()
         assert result == 0
+        mock_provider.close.assert_called_once()
 
     @patch("devsync.cli.setup.Confirm.ask", return_value=False)
     @patch("devsync.cli.setup.Prompt.ask", side_effect=["anthropic", "claude-sonnet-4-20250514"])
@@ -60,6 +60,25 @@ class TestPracticeAdapterNoAI:
 
         assert plan.installs[0].content == "# My Custom Rule\nDo this."
 
+    def test_render_practice_sections(self) -> None:
+        practice = PracticeDeclaration(
+            name="style",
+            intent="Keep code tidy",
+            principles=["Use hints", "Short functions"],
+            enforcement_patterns=["ruff"],
+            examples=["x: int = 1", "def f() -> None: ..."],
+        )
+
+        rendered = PracticeAdapter()._render_practice(practice)
+
+        assert rendered == (
+            "# style\n\nKeep code tidy\n\n"
+            "## Principles\n\n- Use hints\n- Short functions\n\n"
+            "## Enforcement\n\n- ruff\n\n"
+            "## Examples\n\n```\nx: int = 1\n```\n\n```\ndef f() -> None: ...\n```\n"
+        )
+        assert PracticeAdapter()._render_practice(PracticeDeclaration(name="a", intent="b")) == "# a\n\nb\n"
+
 
 class TestPracticeAdapterWithAI:
     def test_adapt_install_action(self, tmp_path: Path) -> None:
@@ -137,3 +156,201 @@ class TestPracticeAdapterWithAI:
 
         assert len(plan.installs) == 1
         assert "failed" in plan.installs[0].reason.lower()
+
+    def test_only_parsed_responses_confirmed(self, tmp_path: Path) -> None:
+        """Test replies are confirmed to the provider only after they parse."""
+        rules_dir = tmp_path / ".claude" / "rules"
+        rules_dir.mkdir(parents=True)
+        (rules_dir / "existing.md").write_text("# Existing")
+
+        valid = LLMResponse(content=json.dumps({"action": "skip", "reason": "Covered"}), model="test")
+        invalid = LLMResponse(content="not json", model="test")
+        mock_provider = MagicMock()
+        mock_provider.complete.side_effect = [invalid, valid]
+
+        adapter = PracticeAdapter(llm_provider=mock_provider)
+        adapter.adapt([PracticeDeclaration(name="a", intent="x")], tmp_path, ["claude"])
+        adapter.adapt([PracticeDeclaration(name="b", intent="y")], tmp_path, ["claude"])
+
+        mock_provider.confirm_response.assert_called_once_with(valid)
+
+
+class TestPracticeAdapterBatching:
+    @staticmethod
+    def _setup_rules(tmp_path: Path) -> None:
+        rules_dir = tmp_path / ".claude" / "rules"
+        rules_dir.mkdir(parents=True)
+        (rules_dir / "existing.md").write_text("# Existing")
+
+    def test_practices_batched_into_one_request(self, tmp_path: Path) -> None:
+        self._setup_rules(tmp_path)
+        practices = [PracticeDeclaration(name=f"p{i}", intent=f"Intent {i}") for i in range(3)]
+        llm_response = LLMResponse(
+            content=json.dumps(
+                {
+                    "adaptations": [
+                        {"practice_name": "p2", "action": "skip", "reason": "Covered"},
+                        {"practice_name": "p0", "action": "install", "reason": "New"},
+                        {"practice_name": "p1", "action": "merge", "reason": "Overlap", "merged_content": "# M"},
+                    ]
+                }
+            ),
+            model="test",
+        )
+        mock_provider = MagicMock()
+        mock_provider.complete.return_value = llm_response
+
+        plan = PracticeAdapter(llm_provider=mock_provider).adapt(practices, tmp_path, ["claude"])
+
+        assert mock_provider.complete.call_count == 1
+        assert [a.practice_name for a in plan.actions] == ["p0", "p1", "p2"]
+        assert [a.action for a in plan.actions] == ["install", "merge", "skip"]
+        assert "Intent 0" in plan.actions[0].content
+        assert plan.actions[0].file_name == "p0.md"
+
+    def test_batch_size_splits_requests(self, tmp_path: Path) -> None:
+        self._setup_rules(tmp_path)
+        practices = [PracticeDeclaration(name=f"p{i}", intent="x") for i in range(5)]
+        mock_provider = MagicMock()
+        mock_provider.complete.return_value = LLMResponse(content=json.dumps({"adaptations": []}), model="test")
+
+        PracticeAdapter(llm_provider=mock_provider, batch_size=2).adapt(practices, tmp_path, ["claude"])
+
+        # Batches of 2, 2, 1; entries missing from a batched reply are retried singly.
+        assert mock_provider.complete.call_count == 2 + 4 + 1
+
+    def test_missing_entries_retried_individually(self, tmp_path: Path) -> None:
+        self._setup_rules(tmp_path)
+        practices = [PracticeDeclaration(name="a", intent="x"), PracticeDeclaration(name="b", intent="y")]
+        batched = LLMResponse(
+            content=json.dumps({"adaptations": [{"practice_name": "a", "action": "skip", "reason": "Covered"}]}),
+            model="test",
+        )
+        single = LLMResponse(content=json.dumps({"action": "install", "reason": "New"}), model="test")
+        mock_provider = MagicMock()
+        mock_provider.complete.side_effect = [batched, single]
+
+        plan = PracticeAdapter(llm_provider=mock_provider).adapt(practices, tmp_path, ["claude"])
+
+        assert [(a.practice_name, a.action) for a in plan.actions] == [("a", "skip"), ("b", "install")]
+
+    def test_duplicate_batch_names_retried_individually(self, tmp_path: Path) -> None:
+        """Test practices sharing a name do not share one batched action."""
+        self._setup_rules(tmp_path)
+        practices = [
+            PracticeDeclaration(name="dup", intent="x"),
+            PracticeDeclaration(name="dup", intent="y"),
+            PracticeDeclaration(name="c", intent="z"),
+        ]
+        batched = LLMResponse(
+            content=json.dumps(
+                {
+                    "adaptations": [
+                        {"practice_name": "dup", "action": "skip", "reason": "Covered"},
+                        {"practice_name": "c", "action": "skip", "reason": "Covered"},
+                    ]
+                }
+            ),
+            model="test",
+        )
+        single_skip = LLMResponse(content=json.dumps({"action": "skip", "reason": "Covered"}), model="test")
+        single_install = LLMResponse(content=json.dumps({"action": "install", "reason": "New"}), model="test")
+        mock_provider = MagicMock()
+        mock_provider.complete.side_effect = [batched, single_skip, single_install]
+
+        plan = PracticeAdapter(llm_provider=mock_provider, max_concurrency=1).adapt(practices, tmp_path, ["claude"])
+
+        assert mock_provider.complete.call_count == 3
+        assert [(a.practice_name, a.action) for a in plan.actions] == [
+            ("dup", "skip"),
+            ("dup", "install"),
+            ("c", "skip"),
+        ]
+
+    def test_duplicate_reply_entries_retried_individually(self, tmp_path: Path) -> None:
+        """Test a reply naming one practice twice is not trusted for it."""
+        self._setup_rules(tmp_path)
+        practices = [PracticeDeclaration(name="a", intent="x"), PracticeDeclaration(name="b", intent="y")]
+        batched = LLMResponse(
+            content=json.dumps(
+                {
+                    "adaptations": [
+                        {"practice_name": "a", "action": "skip", "reason": "Covered"},
+                        {"practice_name": "a", "action": "install", "reason": "New"},
+                        {"practice_name": "b", "action": "skip", "reason": "Covered"},
+                    ]
+                }
+            ),
+            model="test",
+        )
+        single = LLMResponse(content=json.dumps({"action": "install", "reason": "New"}), model="test")
+        mock_provider = MagicMock()
+        mock_provider.complete.side_effect = [batched, single]
+
+        plan = PracticeAdapter(llm_provider=mock_provider).adapt(practices, tmp_path, ["claude"])
+
+        assert mock_provider.complete.call_count == 2
+        assert [(a.practice_name, a.action) for a in plan.actions] == [("a", "install"), ("b", "skip")]
+
+    def test_batch_failure_falls_back_per_practice(self, tmp_path: Path) -> None:
+        self._setup_rules(tmp_path)
+        practices = [PracticeDeclaration(name="a", intent="x"), PracticeDeclaration(name="b", intent="y")]
+        mock_provider = MagicMock()
+        mock_provider.complete.side_effect = LLMProviderError("API error")
+
+        plan = PracticeAdapter(llm_provider=mock_provider).adapt(practices, tmp_path, ["claude"])
+
+        assert mock_provider.complete.call_count == 3
+        assert all("failed" in a.reason.lower() for a in plan.installs)
+        assert len(plan.installs) == 2
+
+    def test_batches_requested_concurrently(self, tmp_path: Path) -> None:
+        import threading
+
+        self._setup_rules(tmp_path)
+        practices = [PracticeDeclaration(name=f"p{i}", intent="x") for i in range(4)]
+        barrier = threading.Barrier(2, timeout=5)
+
+        def complete(prompt: str, **kwargs: object) -> LLMResponse:
+            barrier.wait()  # both batch requests must be in flight at once
+            names = [name for name in ("p0", "p1", "p2", "p3") if f'"{name}"' in prompt]
+            items = [{"practice_name": n, "action": "install", "reason": "ok"} for n in names]
+            return LLMResponse(content=json.dumps({"adaptations": items}), model="test")
+
+        mock_provider = MagicMock()
+        mock_provider.complete.side_effect = complete
+
+        plan = PracticeAdapter(llm_provider=mock_provider, batch_size=2).adapt(practices, tmp_path, ["claude"])
+
+        assert [a.practice_name for a in plan.actions] == ["p0", "p1", "p2", "p3"]
+        assert mock_provider.complete.call_count == 2
+
+
+class TestDetectExistingRules:
+    """Test scanning of existing rule directories."""
+
+    def test_reads_rules_across_directories(self, tmp_path: Path) -> None:
+        """Test every rule file is read and non-rule or undecodable files are skipped."""
+        cursor = tmp_path / ".cursor" / "rules"
+        claude = tmp_path / ".claude" / "rules"
+        cursor.mkdir(parents=True)
+        claude.mkdir(parents=True)
+        (cursor / "a.mdc").write_text("cursor rule")
+        (cursor / "notes.txt").write_text("ignored")
+        (claude / "b.md").write_text("claude rule")
+        (claude / "bad.md").write_bytes(b"\xff\xfe\xfa")
+
+        rules = PracticeAdapter()._detect_existing_rules(tmp_path)
+
+        assert list(rules) == [str(Path(".cursor/rules/a.mdc")), str(Path(".claude/rules/b.md"))]
+        assert rules[str(Path(".claude/rules/b.md"))] == "claude rule"
+
+    def test_reads_only_rule_excerpt(self, tmp_path: Path) -> None:
+        """Test long rule files are truncated to the prompt excerpt."""
+        rules_dir = tmp_path / ".claude" / "rules"
+        rules_dir.mkdir(parents=True)
+        (rules_dir / "long.md").write_text("x" * 10_000)
+
+        rules = PracticeAdapter()._detect_existing_rules(tmp_path)
+
+        assert rules[str(Path(".claude/rules/long.md"))] == "x" * 500
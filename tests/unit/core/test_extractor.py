@@ -155,3 +155,23 @@ class TestPracticeExtractorWithAI:
 
         assert len(result.practices) == 1
         assert result.practices[0].raw_content == "# Test"
+
+    def test_mcp_requests_run_concurrently_in_order(self) -> None:
+        import threading
+
+        barrier = threading.Barrier(2, timeout=5)
+
+        def complete(prompt: str, **kwargs: object) -> LLMResponse:
+            barrier.wait()  # both MCP requests must be in flight at once
+            name = "alpha" if '"alpha"' in prompt else "beta"
+            return LLMResponse(content=json.dumps({"name": name, "description": name, "command": "x"}), model="t")
+
+        mock_provider = MagicMock()
+        mock_provider.complete.side_effect = complete
+
+        result = PracticeExtractor(llm_provider=mock_provider)._extract_with_ai(
+            {}, [{"name": "alpha"}, {"name": "beta"}]
+        )
+
+        assert [s.name for s in result.mcp_servers] == ["alpha", "beta"]
+        assert result.practices == []
@@ -272,6 +272,20 @@ class TestCloneRepository:
         cmd = mock_run.call_args[0][0]
         assert "--depth" in cmd
         assert "5" in cmd
+        assert "--no-tags" not in cmd
+
+    @patch("subprocess.run")
+    @patch("devsync.utils.validation.is_valid_git_url")
+    def test_clone_without_tags(self, mock_valid: MagicMock, mock_run: MagicMock, tmp_path: Path) -> None:
+        """Test cloning with no_tags adds --no-tags."""
+        mock_valid.return_value = True
+        mock_run.return_value = Mock(returncode=0, stderr="", stdout="")
+
+        target_dir = tmp_path / "target"
+        GitOperations.clone_repository("https://github.com/user/repo.git", target_dir=target_dir, no_tags=True)
+
+        cmd = mock_run.call_args[0][0]
+        assert "--no-tags" in cmd
 
     @patch("subprocess.run")
     @patch("shutil.rmtree")
@@ -289,6 +303,25 @@ class TestCloneRepository:
         with pytest.raises(GitOperationError, match="Failed to clone repository"):
             GitOperations.clone_repository("https://github.com/user/repo.git", target_dir=target_dir)
 
+    @patch("subprocess.run")
+    @patch("devsync.utils.validation.is_valid_git_url")
+    def test_clone_falls_back_when_shallow_unsupported(
+        self, mock_valid: MagicMock, mock_run: MagicMock, tmp_path: Path
+    ) -> None:
+        """Test a server rejecting shallow clones triggers one full clone."""
+        mock_valid.return_value = True
+        mock_run.side_effect = [
+            subprocess.CalledProcessError(128, "git", stderr="fatal: dumb http transport does not support shallow"),
+            Mock(returncode=0, stderr="", stdout=""),
+        ]
+
+        target_dir = tmp_path / "target"
+        result = GitOperations.clone_repository("https://example.com/repo.git", target_dir=target_dir)
+
+        assert result == target_dir
+        assert "--depth" in mock_run.call_args_list[0][0][0]
+        assert "--depth" not in mock_run.call_args_list[1][0][0]
+
     @patch("subprocess.run")
     @patch("shutil.rmtree")
     @patch("devsync.utils.validation.is_valid_git_url")
@@ -1,11 +1,29 @@
 """Tests for MCP credential prompting."""
 
+import os
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 from devsync.core.mcp_credential_prompter import build_mcp_config, prompt_mcp_credentials
 from devsync.core.practice import CredentialSpec, MCPDeclaration
 
 
+def _keep_default(prompt: str, **kwargs: object) -> object:
+    """Stand-in for Prompt.ask where the user presses Enter."""
+    return kwargs.get("default")
+
+
+def _token_servers(*names: str) -> list[MCPDeclaration]:
+    return [
+        MCPDeclaration(
+            name=name,
+            description="GitHub API",
+            credentials=[CredentialSpec(name="TOKEN", description="Auth token")],
+        )
+        for name in names
+    ]
+
+
 class TestBuildMCPConfig:
     def test_basic_config(self) -> None:
         server = MCPDeclaration(
@@ -55,6 +73,7 @@ class TestBuildMCPConfig:
 
 
 class TestPromptMCPCredentials:
+    @patch.dict(os.environ, {}, clear=True)
     @patch("devsync.core.mcp_credential_prompter.Prompt.ask", return_value="my-token")
     def test_prompts_for_required_credential(self, mock_ask: MagicMock) -> None:
         servers = [
@@ -71,3 +90,57 @@ class TestPromptMCPCredentials:
         servers = [MCPDeclaration(name="test", description="No creds")]
         result = prompt_mcp_credentials(servers)
         assert result == {}
+
+    @patch.dict(os.environ, {}, clear=True)
+    @patch("devsync.core.mcp_credential_prompter.Prompt.ask", side_effect=_keep_default)
+    def test_offers_value_from_env_file(self, mock_ask: MagicMock, tmp_path: Path) -> None:
+        env_path = tmp_path / ".env"
+        env_path.write_text("TOKEN='saved'\n")
+
+        result = prompt_mcp_credentials(_token_servers("github"), env_path=env_path)
+
+        assert result["github"]["TOKEN"] == "saved"
+        assert mock_ask.call_args.kwargs["default"] == "saved"
+        assert mock_ask.call_args.kwargs["show_default"] is False
+        assert env_path.read_text() == "TOKEN='saved'\n"
+
+    @patch.dict(os.environ, {"TOKEN": "from-env"}, clear=True)
+    @patch("devsync.core.mcp_credential_prompter.Prompt.ask", side_effect=_keep_default)
+    def test_confirmed_environment_value_is_saved(self, mock_ask: MagicMock, tmp_path: Path) -> None:
+        env_path = tmp_path / ".env"
+
+        result = prompt_mcp_credentials(_token_servers("github"), env_path=env_path)
+
+        assert result["github"]["TOKEN"] == "from-env"
+        assert mock_ask.call_args.kwargs["default"] == "from-env"
+        assert env_path.read_text() == "TOKEN='from-env'\n"
+
+    @patch.dict(os.environ, {}, clear=True)
+    @patch("devsync.core.mcp_credential_prompter.Prompt.ask", return_value="rotated")
+    def test_existing_value_can_be_replaced(self, mock_ask: MagicMock, tmp_path: Path) -> None:
+        env_path = tmp_path / ".env"
+        env_path.write_text("TOKEN='saved'\n")
+
+        result = prompt_mcp_credentials(_token_servers("github"), env_path=env_path)
+
+        assert result["github"]["TOKEN"] == "rotated"
+        assert env_path.read_text() == "TOKEN='rotated'\n"
+
+    @patch.dict(os.environ, {}, clear=True)
+    @patch("devsync.core.mcp_credential_prompter.Prompt.ask", side_effect=["shared", "shared"])
+    def test_shared_credential_offered_to_later_servers(self, mock_ask: MagicMock, tmp_path: Path) -> None:
+        env_path = tmp_path / ".env"
+        servers = [
+            MCPDeclaration(
+                name=name,
+                description="GitHub tool",
+                credentials=[CredentialSpec(name="GITHUB_TOKEN", description="Auth token")],
+            )
+            for name in ("issues", "actions")
+        ]
+
+        result = prompt_mcp_credentials(servers, env_path=env_path)
+
+        assert mock_ask.call_args_list[1].kwargs["default"] == "shared"
+        assert result == {"issues": {"GITHUB_TOKEN": "shared"}, "actions": {"GITHUB_TOKEN": "shared"}}
+        assert env_path.read_text() == "GITHUB_TOKEN='shared'\n"
@@ -9,6 +9,7 @@ from devsync.core.package_manifest_v2 import (
     ComponentRef,
     PackageManifestV2,
     detect_manifest_format,
+    load_manifest,
     parse_manifest,
 )
 
@@ -56,6 +57,10 @@ class TestPackageManifestV2:
         loaded = yaml.safe_load(yaml_str)
         assert loaded["name"] == "pkg"
 
+    def test_to_yaml_bytes_matches_to_yaml(self) -> None:
+        m = PackageManifestV2(name="pkg", version="1.0.0", description="Café ✓")
+        assert m.to_yaml_bytes() == m.to_yaml().encode("utf-8")
+
 
 class TestDetectManifestFormat:
     def test_v2_format(self, tmp_path: Path) -> None:
@@ -176,3 +181,35 @@ class TestParseManifest:
         assert len(result.practices) == 1
         assert len(result.components["instructions"]) == 1
         assert len(result.components["hooks"]) == 1
+
+
+class TestLoadManifest:
+    def test_returns_format_and_manifest(self, tmp_path: Path) -> None:
+        (tmp_path / "devsync-package.yaml").write_text(yaml.dump({"name": "pkg", "format_version": "2.0"}))
+        fmt, manifest = load_manifest(tmp_path)
+        assert fmt == "v2"
+        assert manifest is not None
+        assert manifest.name == "pkg"
+
+    def test_no_manifest(self, tmp_path: Path) -> None:
+        assert load_manifest(tmp_path) == (None, None)
+
+    def test_modified_file_reparsed(self, tmp_path: Path) -> None:
+        manifest_file = tmp_path / "devsync-package.yaml"
+        manifest_file.write_text(yaml.dump({"name": "old"}))
+        load_manifest(tmp_path)
+
+        manifest_file.write_text(yaml.dump({"name": "renamed"}))
+        _, manifest = load_manifest(tmp_path)
+        assert manifest is not None
+        assert manifest.name == "renamed"
+
+    def test_callers_get_independent_copies(self, tmp_path: Path) -> None:
+        (tmp_path / "devsync-package.yaml").write_text(yaml.dump({"name": "pkg"}))
+        _, first = load_manifest(tmp_path)
+        assert first is not None
+        first.name = "mutated"
+
+        _, second = load_manifest(tmp_path)
+        assert second is not None
+        assert second.name == "pkg"
@@ -5,11 +5,16 @@ import subprocess
 import sys
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from devsync.core.pip_utils import (
+    DistributionIndex,
     _extract_base_name,
+    _version_satisfies,
     find_pip_executable,
     get_installed_version,
     install_pip_package,
+    install_pip_packages,
     installed_version_satisfies,
     is_pip_installed,
     resolve_pip_package_for_command,
@@ -69,6 +74,13 @@ class TestValidatePipSpec:
     def test_reject_backtick(self) -> None:
         assert validate_pip_spec("requests`whoami`") is False
 
+    def test_repeated_spec_hits_cache(self) -> None:
+        validate_pip_spec.cache_clear()
+        assert validate_pip_spec("mcp-server-git>=1.0") is True
+        assert validate_pip_spec("mcp-server-git>=1.0") is True
+        info = validate_pip_spec.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
 
 class TestExtractBaseName:
     def test_simple(self) -> None:
@@ -112,14 +124,14 @@ class TestGetInstalledVersion:
 
 
 class TestResolvePipPackageForCommand:
-    @patch("devsync.core.pip_utils._find_distribution_for_module")
+    @patch.object(DistributionIndex, "distribution_for_module")
     def test_python_m_pattern(self, mock_find: MagicMock) -> None:
         mock_find.return_value = "mcp-server-fetch"
         result = resolve_pip_package_for_command("python", ["-m", "mcp_server_fetch"])
         assert result == "mcp-server-fetch"
         mock_find.assert_called_once_with("mcp_server_fetch")
 
-    @patch("devsync.core.pip_utils._find_distribution_for_module")
+    @patch.object(DistributionIndex, "distribution_for_module")
     def test_python3_m_pattern(self, mock_find: MagicMock) -> None:
         mock_find.return_value = "some-package"
         result = resolve_pip_package_for_command("python3", ["-m", "some_module"])
@@ -133,13 +145,13 @@ class TestResolvePipPackageForCommand:
         result = resolve_pip_package_for_command("uvx", ["--flag", "value"])
         assert result is None
 
-    @patch("devsync.core.pip_utils._find_distribution_for_script")
+    @patch.object(DistributionIndex, "distribution_for_script")
     def test_console_script_pattern(self, mock_find: MagicMock) -> None:
         mock_find.return_value = "mcp-server-filesystem"
         result = resolve_pip_package_for_command("mcp-server-filesystem", ["--root", "/tmp"])
         assert result == "mcp-server-filesystem"
 
-    @patch("devsync.core.pip_utils._find_distribution_for_script")
+    @patch.object(DistributionIndex, "distribution_for_script")
     def test_unknown_command(self, mock_find: MagicMock) -> None:
         mock_find.return_value = None
         result = resolve_pip_package_for_command("npx", ["-y", "some-server"])
@@ -152,11 +164,77 @@ class TestResolvePipPackageForCommand:
         assert result is None
 
     def test_full_path_python(self) -> None:
-        with patch("devsync.core.pip_utils._find_distribution_for_module") as mock_find:
+        with patch.object(DistributionIndex, "distribution_for_module") as mock_find:
             mock_find.return_value = "pkg"
             result = resolve_pip_package_for_command("/usr/bin/python3", ["-m", "mod"])
             assert result == "pkg"
 
+    @patch.object(DistributionIndex, "distribution_for_script", return_value="python-dist")
+    @patch.object(DistributionIndex, "distribution_for_module")
+    def test_trailing_m_falls_through(self, mock_module: MagicMock, mock_script: MagicMock) -> None:
+        assert resolve_pip_package_for_command("python3.12", ["-u", "-m"]) == "python-dist"
+        mock_module.assert_not_called()
+
+
+class TestDistributionIndex:
+    @patch("devsync.core.pip_utils.importlib.metadata.packages_distributions")
+    def test_metadata_scanned_once(self, mock_pkg_dists: MagicMock) -> None:
+        mock_pkg_dists.return_value = {"yaml": ["PyYAML"]}
+        index = DistributionIndex()
+        assert index.distribution_for_module("yaml") == "PyYAML"
+        assert index.distribution_for_module("yaml") == "PyYAML"
+        mock_pkg_dists.assert_called_once()
+
+    @patch("devsync.core.pip_utils.importlib.metadata.distributions")
+    @patch("devsync.core.pip_utils.importlib.metadata.packages_distributions", return_value={})
+    def test_top_level_fallback(self, mock_pkg_dists: MagicMock, mock_dists: MagicMock) -> None:
+        first = MagicMock(metadata={"Name": "first"})
+        first.read_text.return_value = "shared\nonly_first\n"
+        second = MagicMock(metadata={"Name": "second"})
+        second.read_text.return_value = "shared\n"
+        mock_dists.return_value = [first, second]
+
+        index = DistributionIndex()
+        assert index.distribution_for_module("shared") == "first"
+        assert index.distribution_for_module("only_first") == "first"
+        assert index.distribution_for_module("missing") is None
+        mock_dists.assert_called_once()
+
+    @patch("devsync.core.pip_utils.importlib.metadata.packages_distributions")
+    def test_new_index_sees_later_installs(self, mock_pkg_dists: MagicMock) -> None:
+        mock_pkg_dists.side_effect = [{}, {"newmod": ["new-dist"]}]
+
+        with patch("devsync.core.pip_utils.importlib.metadata.distributions", return_value=[]):
+            assert DistributionIndex().distribution_for_module("newmod") is None
+        assert DistributionIndex().distribution_for_module("newmod") == "new-dist"
+
+    @patch("devsync.core.pip_utils.importlib.metadata.packages_distributions")
+    def test_resolve_reuses_passed_index(self, mock_pkg_dists: MagicMock) -> None:
+        mock_pkg_dists.return_value = {"a": ["dist-a"], "b": ["dist-b"]}
+        index = DistributionIndex()
+        assert resolve_pip_package_for_command("python", ["-m", "a"], index) == "dist-a"
+        assert resolve_pip_package_for_command("python", ["-m", "b"], index) == "dist-b"
+        mock_pkg_dists.assert_called_once()
+
+
+class TestFindDistributionForScript:
+    @patch("devsync.core.pip_utils.importlib.metadata.entry_points")
+    def test_index_built_once(self, mock_eps: MagicMock) -> None:
+        no_dist = MagicMock(dist=None)
+        no_dist.name = "tool"
+        with_dist = MagicMock(dist=MagicMock(metadata={"Name": "tool-dist"}))
+        with_dist.name = "tool"
+        mock_eps.return_value.select.return_value = [no_dist, with_dist]
+
+        index = DistributionIndex()
+        assert index.distribution_for_script("tool") == "tool-dist"
+        assert index.distribution_for_script("other") is None
+        mock_eps.assert_called_once()
+
+    @patch("devsync.core.pip_utils.importlib.metadata.entry_points", side_effect=RuntimeError("broken"))
+    def test_metadata_error_returns_none(self, mock_eps: MagicMock) -> None:
+        assert DistributionIndex().distribution_for_script("tool") is None
+
 
 class TestInstalledVersionSatisfies:
     @patch("devsync.core.pip_utils.get_installed_version")
@@ -182,34 +260,53 @@ class TestInstalledVersionSatisfies:
     @patch("devsync.core.pip_utils.get_installed_version")
     def test_packaging_not_available(self, mock_ver: MagicMock) -> None:
         mock_ver.return_value = "1.0.0"
+        _version_satisfies.cache_clear()
         with patch.dict("sys.modules", {"packaging.specifiers": None, "packaging.version": None}):
             # When packaging is unavailable, falls back to True (installed = good enough)
             assert installed_version_satisfies("requests>=2.0") is True
+        _version_satisfies.cache_clear()
+
+    @patch("devsync.core.pip_utils.get_installed_version", return_value="2.28.0")
+    def test_repeated_check_parses_once(self, mock_ver: MagicMock) -> None:
+        specifiers = pytest.importorskip("packaging.specifiers")
+        _version_satisfies.cache_clear()
+        with patch.object(specifiers, "SpecifierSet", wraps=specifiers.SpecifierSet) as mock_specifier:
+            assert installed_version_satisfies("requests>=2.0") is True
+            assert installed_version_satisfies("requests>=2.0") is True
+        mock_specifier.assert_called_once_with(">=2.0")
 
 
 class TestFindPipExecutable:
-    @patch("devsync.core.pip_utils.subprocess.run")
-    def test_sys_executable_works(self, mock_run: MagicMock) -> None:
-        mock_run.return_value = MagicMock(returncode=0)
+    @patch("devsync.core.pip_utils.importlib.util.find_spec")
+    def test_sys_executable_works(self, mock_find_spec: MagicMock) -> None:
+        mock_find_spec.return_value = MagicMock()
         result = find_pip_executable()
         assert result == sys.executable
+        mock_find_spec.assert_called_once_with("pip")
 
     @patch("devsync.core.pip_utils.shutil.which")
-    @patch("devsync.core.pip_utils.subprocess.run")
-    def test_fallback_to_which(self, mock_run: MagicMock, mock_which: MagicMock) -> None:
-        mock_run.return_value = MagicMock(returncode=1)
+    @patch("devsync.core.pip_utils.importlib.util.find_spec")
+    def test_fallback_to_which(self, mock_find_spec: MagicMock, mock_which: MagicMock) -> None:
+        mock_find_spec.return_value = None
         mock_which.return_value = "/usr/bin/pip"
         result = find_pip_executable()
         assert result == "/usr/bin/pip"
 
     @patch("devsync.core.pip_utils.shutil.which")
-    @patch("devsync.core.pip_utils.subprocess.run")
-    def test_none_when_unavailable(self, mock_run: MagicMock, mock_which: MagicMock) -> None:
-        mock_run.side_effect = OSError("no python")
+    @patch("devsync.core.pip_utils.importlib.util.find_spec")
+    def test_none_when_unavailable(self, mock_find_spec: MagicMock, mock_which: MagicMock) -> None:
+        mock_find_spec.side_effect = ImportError("broken pip")
         mock_which.return_value = None
         result = find_pip_executable()
         assert result is None
 
+    @patch("devsync.core.pip_utils.subprocess.run")
+    @patch("devsync.core.pip_utils.importlib.util.find_spec")
+    def test_detects_without_subprocess(self, mock_find_spec: MagicMock, mock_run: MagicMock) -> None:
+        mock_find_spec.return_value = MagicMock()
+        assert find_pip_executable() == sys.executable
+        mock_run.assert_not_called()
+
 
 class TestInstallPipPackage:
     def test_invalid_spec(self) -> None:
@@ -286,3 +383,22 @@ class TestInstallPipPackage:
         success, msg = install_pip_package("requests")
         assert success is False
         assert "exit code 2" in msg
+
+
+class TestInstallPipPackages:
+    @patch("devsync.core.pip_utils.subprocess.run")
+    @patch("devsync.core.pip_utils.find_pip_executable")
+    def test_single_pip_invocation(self, mock_find: MagicMock, mock_run: MagicMock) -> None:
+        mock_find.return_value = sys.executable
+        mock_run.return_value = MagicMock(returncode=0)
+        success, msg = install_pip_packages(["requests>=2.0", "rich"])
+        assert success is True
+        mock_run.assert_called_once()
+        assert mock_run.call_args[0][0][-2:] == ["requests>=2.0", "rich"]
+
+    @patch("devsync.core.pip_utils.subprocess.run")
+    def test_any_invalid_spec_rejects_all(self, mock_run: MagicMock) -> None:
+        success, msg = install_pip_packages(["requests", "git+https://evil.com/repo"])
+        assert success is False
+        assert "git+https://evil.com/repo" in msg
+        mock_run.assert_not_called()
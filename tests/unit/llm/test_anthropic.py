@@ -2,6 +2,7 @@
 
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
 
 from devsync.llm.anthropic import AnthropicProvider
@@ -96,31 +97,47 @@ class TestAnthropicProvider:
 
     @patch("devsync.llm.anthropic.httpx.Client")
     def test_validate_api_key_success(self, mock_client_cls: MagicMock) -> None:
-        mock_response = _mock_response(
-            200,
-            {
-                "content": [{"type": "text", "text": "ok"}],
-                "model": "claude-sonnet-4-20250514",
-                "usage": {"input_tokens": 3, "output_tokens": 1},
-            },
-        )
         mock_client = MagicMock()
-        mock_client.__enter__ = MagicMock(return_value=mock_client)
-        mock_client.__exit__ = MagicMock(return_value=False)
-        mock_client.post.return_value = mock_response
+        mock_client.get.return_value = _mock_response(200, {"data": []})
         mock_client_cls.return_value = mock_client
 
         provider = AnthropicProvider(api_key="good-key")
         assert provider.validate_api_key() is True
+        mock_client.post.assert_not_called()
+        assert mock_client.get.call_args[1]["headers"]["x-api-key"] == "good-key"
 
     @patch("devsync.llm.anthropic.httpx.Client")
     def test_validate_api_key_failure(self, mock_client_cls: MagicMock) -> None:
-        mock_response = _mock_response(401, {"error": {"message": "Invalid"}})
         mock_client = MagicMock()
-        mock_client.__enter__ = MagicMock(return_value=mock_client)
-        mock_client.__exit__ = MagicMock(return_value=False)
-        mock_client.post.return_value = mock_response
+        mock_client.get.return_value = _mock_response(401, {"error": {"message": "Invalid"}})
         mock_client_cls.return_value = mock_client
 
         provider = AnthropicProvider(api_key="bad-key")
         assert provider.validate_api_key() is False
+
+    @patch("devsync.llm.anthropic.httpx.Client")
+    def test_validate_api_key_network_error(self, mock_client_cls: MagicMock) -> None:
+        mock_client = MagicMock()
+        mock_client.get.side_effect = httpx.ConnectError("offline")
+        mock_client_cls.return_value = mock_client
+
+        provider = AnthropicProvider(api_key="good-key")
+        assert provider.validate_api_key() is False
+
+    @patch("devsync.llm.anthropic.httpx.Client")
+    def test_connection_pool_reused_across_calls(self, mock_client_cls: MagicMock) -> None:
+        mock_client = MagicMock()
+        mock_client.post.return_value = _mock_response(
+            200,
+            {"content": [{"type": "text", "text": "ok"}], "usage": {"input_tokens": 1, "output_tokens": 1}},
+        )
+        mock_client_cls.return_value = mock_client
+
+        provider = AnthropicProvider(api_key="test-key")
+        provider.complete("one")
+        provider.complete("two")
+        provider.close()
+
+        mock_client_cls.assert_called_once()
+        assert mock_client.post.call_count == 2
+        mock_client.close.assert_called_once()
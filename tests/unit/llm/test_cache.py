@@ -0,0 +1,147 @@
+"""Tests for the exact-match LLM response cache."""
+
+import os
+import sqlite3
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from devsync.llm.cache import _MAX_PENDING, CachedLLMProvider, ResponseCache
+from devsync.llm.provider import LLMResponse, resolve_provider
+
+
+def _make_provider() -> MagicMock:
+    provider = MagicMock()
+    provider.name = "mock"
+    provider.default_model = "model-a"
+    provider.complete.return_value = LLMResponse(content="answer", model="model-a", usage={"total_tokens": 3})
+    return provider
+
+
+class TestResponseCache:
+    """Test the SQLite response store."""
+
+    def test_roundtrip_survives_reopen(self, tmp_path: Path) -> None:
+        """Test stored responses are readable from a new connection."""
+        path = tmp_path / "cache.sqlite"
+        cache = ResponseCache(path)
+        cache.put("k", LLMResponse(content="hi", model="m", usage={"total_tokens": 1}))
+        cache.close()
+
+        reopened = ResponseCache(path)
+        cached = reopened.get("k")
+        assert cached is not None
+        assert (cached.content, cached.model, cached.usage) == ("hi", "m", {"total_tokens": 1})
+        assert reopened.get("missing") is None
+
+    def test_key_covers_every_request_field(self) -> None:
+        """Test changing any request field changes the key."""
+        base = ResponseCache.make_key("p", "m", "sys", "prompt", 100)
+        assert base == ResponseCache.make_key("p", "m", "sys", "prompt", 100)
+        assert base != ResponseCache.make_key("p2", "m", "sys", "prompt", 100)
+        assert base != ResponseCache.make_key("p", "m2", "sys", "prompt", 100)
+        assert base != ResponseCache.make_key("p", "m", "sys2", "prompt", 100)
+        assert base != ResponseCache.make_key("p", "m", "sys", "prompt2", 100)
+        assert base != ResponseCache.make_key("p", "m", "sys", "prompt", 200)
+
+    def test_expired_entries_are_misses(self, tmp_path: Path) -> None:
+        """Test entries older than max_age are not returned."""
+        cache = ResponseCache(tmp_path / "cache.sqlite", max_age=-1)
+        cache.put("k", LLMResponse(content="hi", model="m"))
+        assert cache.get("k") is None
+
+    def test_clear_removes_entries(self, tmp_path: Path) -> None:
+        """Test clear() empties the store."""
+        cache = ResponseCache(tmp_path / "cache.sqlite")
+        cache.put("k", LLMResponse(content="hi", model="m"))
+        cache.clear()
+        assert cache.get("k") is None
+
+    def test_outdated_schema_is_replaced(self, tmp_path: Path) -> None:
+        """Test a table from an older layout is dropped instead of breaking reads."""
+        path = tmp_path / "cache.sqlite"
+        conn = sqlite3.connect(str(path))
+        conn.execute("CREATE TABLE responses (key TEXT PRIMARY KEY, content TEXT, model TEXT, usage TEXT)")
+        conn.execute("INSERT INTO responses VALUES ('k', 'old', 'm', '{}')")
+        conn.commit()
+        conn.close()
+
+        cache = ResponseCache(path)
+        assert cache.get("k") is None
+        cache.put("k", LLMResponse(content="new", model="m"))
+        cached = cache.get("k")
+        assert cached is not None and cached.content == "new"
+
+
+class TestCachedLLMProvider:
+    """Test the caching provider wrapper."""
+
+    def test_repeated_request_served_from_cache(self, tmp_path: Path) -> None:
+        """Test an identical confirmed request does not reach the provider twice."""
+        inner = _make_provider()
+        provider = CachedLLMProvider(inner, ResponseCache(tmp_path / "cache.sqlite"))
+
+        first = provider.complete("prompt", system="sys")
+        provider.confirm_response(first)
+        second = provider.complete("prompt", system="sys")
+
+        assert inner.complete.call_count == 1
+        assert second.content == first.content == "answer"
+        assert provider.name == "mock"
+
+    def test_unconfirmed_response_not_cached(self, tmp_path: Path) -> None:
+        """Test a response the caller never validated is requested again."""
+        inner = _make_provider()
+        provider = CachedLLMProvider(inner, ResponseCache(tmp_path / "cache.sqlite"))
+
+        provider.complete("prompt")
+        provider.complete("prompt")
+
+        assert inner.complete.call_count == 2
+
+    def test_unconfirmed_responses_bounded(self, tmp_path: Path) -> None:
+        """Test rejected responses are not all kept until close()."""
+        inner = _make_provider()
+        inner.complete.side_effect = lambda *a, **k: LLMResponse(content="bad", model="model-a")
+        provider = CachedLLMProvider(inner, ResponseCache(tmp_path / "cache.sqlite"))
+
+        for i in range(_MAX_PENDING + 10):
+            provider.complete(f"prompt {i}")
+
+        assert len(provider._pending) == _MAX_PENDING
+
+    def test_provider_name_separates_entries(self, tmp_path: Path) -> None:
+        """Test providers serving the same model name do not share entries."""
+        cache = ResponseCache(tmp_path / "cache.sqlite")
+        first_inner = _make_provider()
+        first = CachedLLMProvider(first_inner, cache)
+        first.confirm_response(first.complete("prompt"))
+
+        second_inner = _make_provider()
+        second_inner.name = "other"
+        CachedLLMProvider(second_inner, cache).complete("prompt")
+
+        assert second_inner.complete.call_count == 1
+
+    def test_nonzero_temperature_bypasses_cache(self, tmp_path: Path) -> None:
+        """Test sampled requests are never cached."""
+        inner = _make_provider()
+        provider = CachedLLMProvider(inner, ResponseCache(tmp_path / "cache.sqlite"))
+
+        provider.complete("prompt", temperature=0.7)
+        provider.complete("prompt", temperature=0.7)
+
+        assert inner.complete.call_count == 2
+
+    def test_resolve_provider_wraps_when_enabled(self) -> None:
+        """Test DEVSYNC_LLM_CACHE=1 wraps the resolved provider."""
+        with patch.dict(os.environ, {"ANTHROPIC_API_KEY": "sk-ant-test", "DEVSYNC_LLM_CACHE": "1"}, clear=False):
+            provider = resolve_provider(preferred_provider="anthropic")
+        assert isinstance(provider, CachedLLMProvider)
+        assert provider.name == "anthropic"
+
+    def test_resolve_provider_unwrapped_by_default(self) -> None:
+        """Test the cache is off unless opted in."""
+        with patch.dict(os.environ, {"ANTHROPIC_API_KEY": "sk-ant-test"}, clear=False):
+            os.environ.pop("DEVSYNC_LLM_CACHE", None)
+            provider = resolve_provider(preferred_provider="anthropic")
+        assert not isinstance(provider, CachedLLMProvider)
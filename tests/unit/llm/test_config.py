@@ -74,3 +74,11 @@ class TestLoadSaveConfig:
         config_path.write_text("")
         config = load_config(config_path)
         assert config.provider is None
+
+    def test_load_sees_saved_changes(self, tmp_path: Path) -> None:
+        config_path = tmp_path / "config.yaml"
+        save_config(LLMConfig(provider="anthropic"), config_path)
+        assert load_config(config_path).provider == "anthropic"
+
+        save_config(LLMConfig(provider="openai"), config_path)
+        assert load_config(config_path).provider == "openai"
@@ -2,6 +2,7 @@
 
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
 
 from devsync.llm.openai_provider import OpenAIProvider
@@ -83,3 +84,30 @@ class TestOpenAIProvider:
         with pytest.raises(LLMProviderError) as exc_info:
             provider.complete("test")
         assert exc_info.value.status_code == 429
+
+    @patch("devsync.llm.openai_provider.httpx.Client")
+    def test_validate_api_key_lists_models(self, mock_client_cls: MagicMock) -> None:
+        mock_client = MagicMock()
+        mock_client.get.return_value = _mock_response(200, {"data": []})
+        mock_client_cls.return_value = mock_client
+
+        provider = OpenAIProvider(api_key="good-key")
+        assert provider.validate_api_key() is True
+        mock_client.post.assert_not_called()
+        assert mock_client.get.call_args[0][0].endswith("/v1/models")
+
+    @patch("devsync.llm.openai_provider.httpx.Client")
+    def test_validate_api_key_failure(self, mock_client_cls: MagicMock) -> None:
+        mock_client = MagicMock()
+        mock_client.get.return_value = _mock_response(401, {"error": {"message": "Invalid"}})
+        mock_client_cls.return_value = mock_client
+
+        assert OpenAIProvider(api_key="bad-key").validate_api_key() is False
+
+    @patch("devsync.llm.openai_provider.httpx.Client")
+    def test_validate_api_key_network_error(self, mock_client_cls: MagicMock) -> None:
+        mock_client = MagicMock()
+        mock_client.get.side_effect = httpx.ConnectError("offline")
+        mock_client_cls.return_value = mock_client
+
+        assert OpenAIProvider(api_key="good-key").validate_api_key() is False
@@ -2,6 +2,7 @@
 
 from devsync.llm.prompts import (
     ADAPT_PRACTICE_PROMPT,
+    ADAPT_PRACTICES_BATCH_PROMPT,
     EXTRACT_MCP_PROMPT,
     EXTRACT_PRACTICES_PROMPT,
     MERGE_PRACTICES_PROMPT,
@@ -30,6 +31,16 @@ class TestPromptTemplates:
         assert "cursor" in result
         assert "test" in result
 
+    def test_adapt_prompts_share_prefix_across_practices(self) -> None:
+        for template, key in (
+            (ADAPT_PRACTICE_PROMPT, "practice_json"),
+            (ADAPT_PRACTICES_BATCH_PROMPT, "practices_json"),
+        ):
+            first = template.format(**{key: '{"name": "a"}'}, existing_rules="# Existing", tool_name="cursor")
+            second = template.format(**{key: '{"name": "b"}'}, existing_rules="# Existing", tool_name="cursor")
+            assert first.rsplit('{"name"', 1)[0] == second.rsplit('{"name"', 1)[0]
+            assert first.endswith('{"name": "a"}')
+
     def test_merge_practices_renders(self) -> None:
         result = MERGE_PRACTICES_PROMPT.format(
             existing_content="# Old rules",
@@ -58,3 +69,8 @@ class TestFormatFilesForExtraction:
     def test_empty_files(self) -> None:
         result = format_files_for_extraction({})
         assert result == ""
+
+    def test_exact_layout(self) -> None:
+        files = {"a.md": "one", "b.md": "two\n"}
+        result = format_files_for_extraction(files)
+        assert result == "--- a.md ---\none\n\n--- b.md ---\ntwo\n\n"
@@ -87,3 +87,13 @@ class TestResolveProvider:
             provider = resolve_provider(preferred_model="claude-haiku-4-5-20251001")
             assert provider is not None
             assert provider.default_model == "claude-haiku-4-5-20251001"
+
+
+class TestProviderImports:
+    def test_module_import_skips_httpx(self) -> None:
+        import subprocess
+        import sys
+
+        code = "import sys, devsync.llm.provider; print('httpx' in sys.modules)"
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == "False"
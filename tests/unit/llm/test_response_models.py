@@ -10,6 +10,7 @@ from devsync.llm.response_models import (
     AdaptationPlan,
     ExtractionResult,
     parse_adaptation_response,
+    parse_batch_adaptation_response,
     parse_extraction_response,
     parse_merge_response,
 )
@@ -80,6 +81,15 @@ class TestParseExtractionResponse:
         practices = parse_extraction_response(response)
         assert practices == []
 
+    def test_practices_not_a_list(self) -> None:
+        with pytest.raises(ValueError, match="must be a list"):
+            parse_extraction_response(json.dumps({"practices": {"name": "x"}}))
+
+    def test_practice_missing_name_raises_value_error(self) -> None:
+        response = json.dumps({"practices": [{"intent": "No name"}]})
+        with pytest.raises(ValueError, match="practice #0"):
+            parse_extraction_response(response)
+
 
 class TestParseAdaptationResponse:
     def test_install_action(self) -> None:
@@ -111,6 +121,34 @@ class TestParseAdaptationResponse:
         with pytest.raises(ValueError, match="Invalid JSON"):
             parse_adaptation_response("{bad")
 
+    def test_non_object_json(self) -> None:
+        with pytest.raises(ValueError, match="Expected a JSON object"):
+            parse_adaptation_response('["install"]')
+
+    def test_unknown_action_rejected(self) -> None:
+        with pytest.raises(ValueError, match="Unknown adaptation action"):
+            parse_adaptation_response(json.dumps({"action": "replace", "practice_name": "x"}))
+
+    @pytest.mark.parametrize("action", [["install"], {}])
+    def test_non_string_action_rejected(self, action: object) -> None:
+        with pytest.raises(ValueError, match="Unknown adaptation action"):
+            parse_adaptation_response(json.dumps({"action": action, "practice_name": "x"}))
+
+    def test_batch_drops_unknown_actions(self) -> None:
+        response = json.dumps(
+            {
+                "adaptations": [
+                    {"action": "install", "practice_name": "a"},
+                    {"action": "rewrite", "practice_name": "b"},
+                    {"action": ["install"], "practice_name": "c"},
+                    {"action": {}, "practice_name": "d"},
+                    "not an object",
+                ]
+            }
+        )
+        actions = parse_batch_adaptation_response(response)
+        assert [a.practice_name for a in actions] == ["a"]
+
 
 class TestParseMergeResponse:
     def test_valid(self) -> None:
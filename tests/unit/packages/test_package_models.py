@@ -66,6 +66,12 @@ class TestSecretConfidence:
         assert SecretConfidence.MEDIUM.value == "medium"
         assert SecretConfidence.SAFE.value == "safe"
 
+    def test_is_secret(self) -> None:
+        """Test only HIGH and MEDIUM count as secrets."""
+        assert SecretConfidence.HIGH.is_secret is True
+        assert SecretConfidence.MEDIUM.is_secret is True
+        assert SecretConfidence.SAFE.is_secret is False
+
 
 class TestCredentialDescriptor:
     """Test CredentialDescriptor dataclass."""
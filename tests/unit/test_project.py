@@ -98,6 +98,16 @@ class TestProjectDetection:
 
         assert is_in_project() is False
 
+    def test_find_project_root_after_earlier_miss(self, temp_dir: Path):
+        """Test a root created after a failed lookup is still found."""
+        project = temp_dir / "project"
+        project.mkdir()
+        assert find_project_root(project) is None
+
+        (project / "pyproject.toml").write_text("")
+
+        assert find_project_root(project) == project.resolve()
+
 
 class TestProjectInstructionsDir:
     """Test project instructions directory management."""
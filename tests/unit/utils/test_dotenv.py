@@ -11,6 +11,7 @@ from devsync.utils.dotenv import (
     merge_env_configs,
     save_env_config,
     set_env_variable,
+    set_env_variables,
 )
 
 
@@ -317,6 +318,45 @@ class TestSetEnvVariable:
         assert '"value with spaces"' in content or "'value with spaces'" in content
 
 
+class TestSetEnvVariables:
+    """Test set_env_variables function."""
+
+    def test_matches_repeated_set_env_variable(self, tmp_path: Path) -> None:
+        """Test the batched write produces the same file as one call per variable."""
+        original = "# comment\nKEEP=1\nAPI_KEY='old'\nexport OTHER=x"
+        variables = {"API_KEY": "new", "TOKEN": "it's a \\ path", "SECOND": "2"}
+        batched = tmp_path / "batched" / ".env"
+        single = tmp_path / "single" / ".env"
+        for path in (batched, single):
+            path.parent.mkdir()
+            path.write_text(original)
+
+        set_env_variables(batched, variables)
+        for key, value in variables.items():
+            set_env_variable(single, key, value)
+
+        assert batched.read_text() == single.read_text()
+        assert load_env_config(batched, InstallationScope.PROJECT).variables["TOKEN"] == "it's a \\ path"
+
+    def test_creates_file_and_gitignore(self, tmp_path: Path) -> None:
+        """Test a missing .env file is created and gitignored."""
+        env_path = tmp_path / ".env"
+
+        set_env_variables(env_path, {"A": "1", "B": "2"})
+
+        assert env_path.read_text() == "A='1'\nB='2'\n"
+        assert ".env" in (tmp_path / ".gitignore").read_text()
+
+    def test_invalid_name_writes_nothing(self, tmp_path: Path) -> None:
+        """Test an invalid name is rejected before the file is touched."""
+        env_path = tmp_path / ".env"
+
+        with pytest.raises(ValueError, match="Invalid environment variable name"):
+            set_env_variables(env_path, {"GOOD": "1", "bad": "2"})
+
+        assert not env_path.exists()
+
+
 class TestEnsureEnvGitignored:
     """Test ensure_env_gitignored function."""
 
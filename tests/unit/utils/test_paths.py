@@ -256,6 +256,12 @@ class TestEnsureDirectoryExists:
         ensure_directory_exists(existing_dir)
         assert existing_dir.exists()
 
+    def test_existing_directory_skips_mkdir(self, tmp_path: Path) -> None:
+        """Test mkdir is not attempted when the directory is already there."""
+        with patch.object(Path, "mkdir") as mock_mkdir:
+            ensure_directory_exists(tmp_path)
+        mock_mkdir.assert_not_called()
+
 
 class TestSafeFileName:
     """Test safe_file_name function."""